@@ -398,8 +398,9 @@ class MessageManager:
 		"""Get current message list, potentially trimmed to max tokens"""
 		msg = [m.message for m in self.state.history.messages]
 
-		# Log message history for debugging
-		logger.debug(self._log_history_lines())
+		# Log message history for debugging (only build it if it will actually be emitted, it walks every message)
+		if logger.isEnabledFor(logging.DEBUG):
+			logger.debug(self._log_history_lines())
 
 		return msg
 
@@ -523,6 +524,7 @@ class MessageManager:
 					elif 'text' in item and isinstance(item, dict):
 						text += item['text']
 				msg.message.content = text
+				msg.clear_message_dump()
 				self.state.history.messages[-1] = msg
 
 			if diff <= 0:
@@ -1,12 +1,13 @@
 from __future__ import annotations
 
+from itertools import islice
 from typing import TYPE_CHECKING, Any
 from warnings import filterwarnings
 
 from langchain_core._api import LangChainBetaWarning
 from langchain_core.load import dumpd, load
 from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, SystemMessage, ToolMessage
-from pydantic import BaseModel, ConfigDict, Field, model_serializer, model_validator
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, model_serializer, model_validator
 
 filterwarnings('ignore', category=LangChainBetaWarning)
 
@@ -19,6 +20,11 @@ class MessageMetadata(BaseModel):
 
 	tokens: int = 0
 	message_type: str | None = None
+	message_class: str | None = None  # base message class name, cached by ManagedMessage so trimming can skip isinstance()
+
+
+# the classes the trimming helpers tell apart, subclasses such as AIMessageChunk are recorded under these
+_BASE_MESSAGE_CLASSES = (SystemMessage, HumanMessage, AIMessage, ToolMessage)
 
 
 class ManagedMessage(BaseModel):
@@ -29,6 +35,10 @@ class ManagedMessage(BaseModel):
 
 	model_config = ConfigDict(arbitrary_types_allowed=True)
 
+	# last dumpd(message) output and the message it was made from. Code that changes the message in
+	# place (content, tool_calls, additional_kwargs) must call clear_message_dump() afterwards
+	_message_dump: tuple[BaseMessage, dict[str, Any]] | None = PrivateAttr(default=None)
+
 	# https://github.com/pydantic/pydantic/discussions/7558
 	@model_serializer(mode='wrap')
 	def to_json(self, original_dump):
@@ -41,10 +51,18 @@ class ManagedMessage(BaseModel):
 		data = original_dump(self)
 
 		# NOTE: We override the message field to use langchain JSON serialization.
-		data['message'] = dumpd(self.message)
+		# dumpd walks the whole langchain object, so reuse the previous result until the message is
+		# replaced or clear_message_dump() is called. The message is held, not its id(), which can be reused.
+		if self._message_dump is None or self._message_dump[0] is not self.message:
+			self._message_dump = (self.message, dumpd(self.message))
+		data['message'] = self._message_dump[1]
 
 		return data
 
+	def clear_message_dump(self) -> None:
+		"""Drop the cached serialization after the message was changed in place"""
+		self._message_dump = None
+
 	@model_validator(mode='before')
 	@classmethod
 	def validate(
@@ -65,6 +83,17 @@ class ManagedMessage(BaseModel):
 			value['message'] = load(value['message'])
 		return value
 
+	@model_validator(mode='after')
+	def cache_message_class(self) -> ManagedMessage:
+		"""Cache the langchain message class name on the metadata"""
+		message_class = next(
+			(cls.__name__ for cls in _BASE_MESSAGE_CLASSES if isinstance(self.message, cls)), type(self.message).__name__
+		)
+		if self.metadata.message_class != message_class:
+			# callers may pass the same metadata for several messages, so don't write to theirs
+			self.metadata = self.metadata.model_copy(update={'message_class': message_class})
+		return self
+
 
 class MessageHistory(BaseModel):
 	"""History of messages with metadata"""
@@ -114,14 +143,14 @@ class MessageHistory(BaseModel):
 	def remove_oldest_message(self) -> None:
 		"""Remove oldest non-system message"""
 		for i, msg in enumerate(self.messages):
-			if not isinstance(msg.message, SystemMessage):
+			if msg.metadata.message_class != 'SystemMessage':
 				self.current_tokens -= msg.metadata.tokens
 				self.messages.pop(i)
 				break
 
 	def remove_last_state_message(self) -> None:
 		"""Remove last state message from history"""
-		if len(self.messages) > 2 and isinstance(self.messages[-1].message, HumanMessage):
+		if len(self.messages) > 2 and self.messages[-1].metadata.message_class == 'HumanMessage':
 			self.current_tokens -= self.messages[-1].metadata.tokens
 			self.messages.pop()
 	
@@ -132,32 +161,19 @@ class MessageHistory(BaseModel):
 			max_tokens: Maximum allowed tokens
 			preserve_recent: Number of recent messages to always preserve
 		"""
-		if self.current_tokens <= max_tokens:
-			return
-		
-		# Always preserve system messages and recent messages
-		preserved_indices = set()
-		
-		# Mark system messages for preservation
+		if self.current_tokens <= max_tokens or len(self.messages) <= preserve_recent:
+			return  # under budget, or every message is a protected recent one
+
+		# Single pass from oldest to newest: drop anything that isn't a system message or one of the
+		# last `preserve_recent` messages until we are under the limit, then rebind the list once
+		recent_start = len(self.messages) - preserve_recent
+		kept: list[ManagedMessage] = []
 		for i, msg in enumerate(self.messages):
-			if isinstance(msg.message, SystemMessage):
-				preserved_indices.add(i)
-		
-		# Mark recent messages for preservation
-		if len(self.messages) > preserve_recent:
-			for i in range(len(self.messages) - preserve_recent, len(self.messages)):
-				preserved_indices.add(i)
-		
-		# Remove messages from oldest to newest until under token limit
-		i = 0
-		while self.current_tokens > max_tokens and i < len(self.messages):
-			if i not in preserved_indices:
-				self.current_tokens -= self.messages[i].metadata.tokens
-				self.messages.pop(i)
-				# Adjust preserved indices after removal
-				preserved_indices = {idx - 1 if idx > i else idx for idx in preserved_indices}
-			else:
-				i += 1
+			if self.current_tokens > max_tokens and i < recent_start and msg.metadata.message_class != 'SystemMessage':
+				self.current_tokens -= msg.metadata.tokens
+				continue
+			kept.append(msg)
+		self.messages = kept
 	
 	def compress_history(self, max_tokens: int) -> str | None:
 		"""Compress history by summarizing older messages
@@ -165,15 +181,15 @@ class MessageHistory(BaseModel):
 		Returns:
 			Summary of compressed messages if any were compressed, None otherwise
 		"""
-		if self.current_tokens <= max_tokens:
-			return None
-		
+		if self.current_tokens <= max_tokens or len(self.messages) <= 5:
+			return None  # under budget, or nothing older than the last 5 messages to compress
+
 		# Find messages to compress (older than last 5, non-system)
 		messages_to_compress = []
 		indices_to_remove = []
 		
-		for i, msg in enumerate(self.messages[:-5]):  # Keep last 5 messages
-			if not isinstance(msg.message, SystemMessage):
+		for i, msg in enumerate(islice(self.messages, max(len(self.messages) - 5, 0))):  # Keep last 5 messages
+			if msg.metadata.message_class != 'SystemMessage':
 				messages_to_compress.append(msg)
 				indices_to_remove.append(i)
 		
@@ -183,16 +199,20 @@ class MessageHistory(BaseModel):
 		# Create summary of compressed messages
 		summary_parts = []
 		for msg in messages_to_compress[:5]:  # Summarize up to 5 messages
-			if isinstance(msg.message, AIMessage) and msg.message.tool_calls:
+			if msg.metadata.message_class == 'AIMessage' and msg.message.tool_calls:
 				# Extract action from tool calls
 				tool_call = msg.message.tool_calls[0]
 				if 'args' in tool_call and 'action' in tool_call['args']:
 					actions = tool_call['args']['action']
 					if isinstance(actions, list) and actions:
-						action_name = next(iter(actions[0].keys())) if isinstance(actions[0], dict) else str(actions[0])
+						action_name = next(iter(actions[0])) if isinstance(actions[0], dict) else str(actions[0])
 						summary_parts.append(f"• Executed: {action_name}")
-			elif isinstance(msg.message, HumanMessage):
-				content = str(msg.message.content)[:100] + '...' if len(str(msg.message.content)) > 100 else str(msg.message.content)
+			elif msg.metadata.message_class == 'HumanMessage':
+				content = msg.message.content
+				if not isinstance(content, str):
+					content = str(content)
+				if len(content) > 100:
+					content = content[:100] + '...'
 				summary_parts.append(f"• State: {content}")
 		
 		if len(messages_to_compress) > 5:
@@ -200,12 +220,10 @@ class MessageHistory(BaseModel):
 		
 		summary = "Previous actions summary:\n" + "\n".join(summary_parts)
 		
-		# Remove compressed messages
-		tokens_removed = 0
-		for i in reversed(indices_to_remove):  # Remove from end to preserve indices
-			tokens_removed += self.messages[i].metadata.tokens
-			self.messages.pop(i)
-		
+		# Remove compressed messages with a single rebuild instead of popping one index at a time
+		to_remove = set(indices_to_remove)
+		tokens_removed = sum(msg.metadata.tokens for msg in messages_to_compress)
+		self.messages = [msg for i, msg in enumerate(self.messages) if i not in to_remove]
 		self.current_tokens -= tokens_removed
 		
 		return summary
@@ -1581,15 +1581,25 @@ class BrowserSession(BaseModel):
 	async def get_tabs_info(self) -> list[TabInfo]:
 		"""Get information about all tabs"""
 
+		pages = self.browser_context.pages
+
+		# page.title() is one CDP round-trip per tab, fetch them all concurrently instead of one after another
+		titles = await asyncio.gather(
+			*(asyncio.wait_for(page.title(), timeout=1) for page in pages),
+			return_exceptions=True,
+		)
+
 		tabs_info = []
-		for page_id, page in enumerate(self.browser_context.pages):
-			try:
-				tab_info = TabInfo(page_id=page_id, url=page.url, title=await asyncio.wait_for(page.title(), timeout=1))
-			except TimeoutError:
+		for page_id, (page, title) in enumerate(zip(pages, titles)):
+			if isinstance(title, TimeoutError):
 				# page.title() can hang forever on tabs that are crashed/disappeared/about:blank
 				# we dont want to try automating those tabs because they will hang the whole script
 				self.logger.debug(f'⚠️ Failed to get tab info for tab #{page_id}: {_log_pretty_url(page.url)} (ignoring)')
 				tab_info = TabInfo(page_id=page_id, url='about:blank', title='ignore this tab and do not use it')
+			elif isinstance(title, BaseException):
+				raise title
+			else:
+				tab_info = TabInfo(page_id=page_id, url=page.url, title=title)
 			tabs_info.append(tab_info)
 
 		return tabs_info
@@ -1987,9 +1997,19 @@ class BrowserSession(BaseModel):
 			last_activity = asyncio.get_event_loop().time()
 			# self.logger.debug(f'Request resolved: {request.url} ({content_type})')
 
+		async def on_request_failed(request):
+			# failed/aborted requests never get a response, don't wait for them until the timeout
+			if request not in pending_requests:
+				return
+
+			nonlocal last_activity
+			pending_requests.remove(request)
+			last_activity = asyncio.get_event_loop().time()
+
 		# Attach event listeners
 		page.on('request', on_request)
 		page.on('response', on_response)
+		page.on('requestfailed', on_request_failed)
 
 		now = asyncio.get_event_loop().time()
 		try:
@@ -2014,6 +2034,7 @@ class BrowserSession(BaseModel):
 			# Clean up event listeners
 			page.remove_listener('request', on_request)
 			page.remove_listener('response', on_response)
+			page.remove_listener('requestfailed', on_request_failed)
 
 		elapsed = now - start_time
 		if elapsed > 1:
@@ -2345,7 +2366,21 @@ class BrowserSession(BaseModel):
 				highlight_elements=self.browser_profile.highlight_elements,
 			)
 
-			tabs_info = await self.get_tabs_info()
+			# these only read the page, so overlap their round-trips instead of awaiting them one after another.
+			# the screenshot has to wait for get_clickable_elements() above, it needs the highlights to be drawn.
+			# a TaskGroup cancels the screenshot if the tab listing fails, so its viewport-resizing fallback
+			# can't keep running into the next action
+			try:
+				async with asyncio.TaskGroup() as tg:
+					tabs_task = tg.create_task(self.get_tabs_info())
+					screenshot_task = tg.create_task(self.take_screenshot())
+			except ExceptionGroup as eg:
+				raise eg.exceptions[0]
+			tabs_info, screenshot_b64 = tabs_task.result(), screenshot_task.result()
+
+			# read after the screenshot's load-state wait, so this is the loaded page's title. tabs_info can't be
+			# reused for it, a slow tab is listed there with a placeholder title telling the LLM to ignore it
+			title = await page.title()
 
 			# Get all cross-origin iframes within the page and open them in new tabs
 			# mark the titles of the new tabs so the LLM knows to check them for additional content
@@ -2368,14 +2403,14 @@ class BrowserSession(BaseModel):
 			# 		)
 			# 	)
 
-			screenshot_b64 = await self.take_screenshot()
+			# read after the screenshot, its fallback path temporarily resizes the viewport
 			pixels_above, pixels_below = await self.get_scroll_info(page)
 
 			self.browser_state_summary = BrowserStateSummary(
 				element_tree=content.element_tree,
 				selector_map=content.selector_map,
 				url=page.url,
-				title=await page.title(),
+				title=title,
 				tabs=tabs_info,
 				screenshot=screenshot_b64,
 				pixels_above=pixels_above,
@@ -2417,7 +2452,8 @@ class BrowserSession(BaseModel):
 				caret='initial',
 			)
 
-			screenshot_b64 = base64.b64encode(screenshot).decode('utf-8')
+			# full-page PNGs can be several MB, encode off the event loop so other sessions/agents keep running
+			screenshot_b64 = (await asyncio.to_thread(base64.b64encode, screenshot)).decode('utf-8')
 			return screenshot_b64
 		except Exception as e:
 			self.logger.error(
@@ -2459,7 +2495,7 @@ class BrowserSession(BaseModel):
 			)
 			# TODO: manually take multiple clipped screenshots to capture the full height and stitch them together?
 
-			screenshot_b64 = base64.b64encode(screenshot).decode('utf-8')
+			screenshot_b64 = (await asyncio.to_thread(base64.b64encode, screenshot)).decode('utf-8')
 			return screenshot_b64
 
 		finally:
@@ -3148,9 +3184,9 @@ class BrowserSession(BaseModel):
 	@require_initialization
 	async def get_scroll_info(self, page: Page) -> tuple[int, int]:
 		"""Get scroll position information for the current page."""
-		scroll_y = await page.evaluate('window.scrollY')
-		viewport_height = await page.evaluate('window.innerHeight')
-		total_height = await page.evaluate('document.documentElement.scrollHeight')
+		scroll_y, viewport_height, total_height = await page.evaluate(
+			'() => [window.scrollY, window.innerHeight, document.documentElement.scrollHeight]'
+		)
 		pixels_above = scroll_y
 		pixels_below = total_height - (scroll_y + viewport_height)
 		return pixels_above, pixels_below
@@ -8,6 +8,8 @@ from .enhanced_scroll import (
     ScrollStrategy,
     ScrollableAreaInfo,
     EnhancedScrollAction,
+    BatchedScrollAction,
+    DetectScrollableAreasAction,
     ScrollToElementAction,
     ScrollUntilVisibleAction,
     InfiniteScrollAction,
@@ -19,6 +21,8 @@ __all__ = [
     "ScrollStrategy",
     "ScrollableAreaInfo",
     "EnhancedScrollAction",
+    "BatchedScrollAction",
+    "DetectScrollableAreasAction",
     "ScrollToElementAction",
     "ScrollUntilVisibleAction",
     "InfiniteScrollAction",
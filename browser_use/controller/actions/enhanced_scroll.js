@@ -0,0 +1,755 @@
+// Page-side half of the enhanced scroll actions in enhanced_scroll.py.
+// Installs the helpers on window.__buScroll once per document, each action then calls its helper by name
+// instead of sending its whole script with every page.evaluate.
+(() => {
+  if (window.__buScroll) {
+    return;
+  }
+
+  // computed overflow values that let an element scroll its own content
+  const SCROLLABLE_OVERFLOW = new Set(['auto', 'scroll', 'overlay']);
+
+  // Auto-detected scroll containers (and the list of scrollable elements) are cached per document
+  // until the DOM, any attribute, text or the viewport changes, so repeated scrolls skip the full-page scan.
+  // All attributes are watched since panels and dropdowns usually open via hidden/open/aria-*/data-* toggles
+  const containerCache = (() => {
+    const entries = new Map();
+    const invalidate = () => { entries.clear(); observer.disconnect(); };
+    const observer = new MutationObserver(invalidate);
+    window.addEventListener('resize', invalidate);
+    // images and iframes finishing loading resize their parents without a mutation. Their load events
+    // don't propagate past the document, so this has to capture there rather than on window
+    document.addEventListener('load', invalidate, true);
+    return {
+      get: key => entries.get(key),
+      set: (key, el) => {
+        // only observe while something is cached
+        if (!entries.size) {
+          observer.observe(document.documentElement, {
+            childList: true, subtree: true, attributes: true, characterData: true
+          });
+        }
+        entries.set(key, el);
+      }
+    };
+  })();
+
+  // geometry is checked before the computed style, which is far more expensive to read
+  const isScrollContainer = el =>
+    el.clientHeight >= window.innerHeight * 0.5 &&
+    el.scrollHeight > el.clientHeight &&
+    SCROLLABLE_OVERFLOW.has(getComputedStyle(el).overflowY);
+
+  // Known results/content panes plus every element containing a search result, in document order
+  // so the outermost one wins
+  const mainContentCandidates = () => {
+    const resultAncestors = new Set();
+    for (const result of document.querySelectorAll('[data-test*="search-result"]')) {
+      for (let el = result.parentElement; el && !resultAncestors.has(el); el = el.parentElement) {
+        resultAncestors.add(el);
+      }
+    }
+    const candidates = new Set([
+      ...document.querySelectorAll('#search-results-container, .search-results, .main-content'),
+      ...resultAncestors
+    ]);
+    return [...candidates].sort((a, b) => a.compareDocumentPosition(b) & Node.DOCUMENT_POSITION_FOLLOWING ? -1 : 1);
+  };
+
+  const firstScrollContainer = () => {
+    const walker = document.createTreeWalker(document.documentElement, NodeFilter.SHOW_ELEMENT);
+    for (let el = walker.currentNode; el; el = walker.nextNode()) {
+      if (isScrollContainer(el)) {
+        return el;
+      }
+    }
+    return null;
+  };
+
+  // Returns the element matching selector, or else the auto-detected scroll container for the mode:
+  // 'main-content' looks for a known results/content pane, 'any' for the first big scrollable element.
+  // Falls back to the document scroller
+  const findScrollContainer = (selector, mode) => {
+    if (selector) {
+      const container = document.querySelector(selector);
+      if (!container) {
+        throw new Error('Container not found: ' + selector);
+      }
+      return container;
+    }
+
+    let container = containerCache.get(mode);
+    if (!container || !container.isConnected) {
+      container = (mode === 'main-content' ? mainContentCandidates().find(isScrollContainer) : firstScrollContainer())
+        || document.scrollingElement
+        || document.documentElement;
+      containerCache.set(mode, container);
+    }
+    return container;
+  };
+
+  const isRootScroller = container =>
+    container === document.scrollingElement ||
+    container === document.documentElement ||
+    container === document.body;
+
+  const describeContainer = container =>
+    (container.id && '#' + container.id) ||
+    (container.classList.length ? container.tagName.toLowerCase() + '.' + container.classList[0] : container.tagName.toLowerCase());
+
+  // Resolves on the next animation frame, with a timeout since frames don't fire in background tabs
+  const nextFrame = () => new Promise(resolve => {
+    requestAnimationFrame(resolve);
+    setTimeout(resolve, 100);
+  });
+
+  // Resolves once a smooth scroll has finished. scrollend doesn't bubble, but a capturing listener
+  // on window sees it for every scroller. Nothing fires when there was nothing to scroll, hence the timeout
+  const waitForScrollEnd = (timeout) => new Promise(resolve => {
+    const done = () => {
+      window.removeEventListener('scrollend', done, true);
+      clearTimeout(fallback);
+      resolve();
+    };
+    const fallback = setTimeout(done, timeout);
+    window.addEventListener('scrollend', done, true);
+  });
+
+  // Resolves with true on the first DOM mutation, or with false after timeout ms if nothing changes
+  const waitForMutation = (timeout) => new Promise(resolve => {
+    const done = mutated => {
+      observer.disconnect();
+      clearTimeout(timer);
+      resolve(mutated);
+    };
+    const observer = new MutationObserver(() => done(true));
+    observer.observe(document.body, { childList: true, subtree: true, characterData: true });
+    const timer = setTimeout(() => done(false), timeout);
+  });
+
+  // Starts the scroll and returns what describeScroll() needs to report on it once it is done.
+  // The scroll amount is resolved here so the viewport size doesn't cost extra round-trips
+  const startScroll = (options) => {
+    const { direction, amount, strategy, targetSelector, smooth } = options;
+    const vertical = direction === 'up' || direction === 'down';
+
+    let scrollAmount = 0;
+    if (strategy === 'viewport') {
+      // amount is a percentage of the viewport
+      scrollAmount = (vertical ? window.innerHeight : window.innerWidth) * (amount || 100) / 100;
+    } else if (strategy === 'page') {
+      scrollAmount = vertical ? window.innerHeight : window.innerWidth;
+    } else if (strategy !== 'to_end') {
+      scrollAmount = amount || 300;
+    }
+    if (direction === 'up' || direction === 'left') {
+      scrollAmount = -scrollAmount;
+    }
+
+    const container = findScrollContainer(targetSelector, 'main-content');
+
+    let scrollX = 0, scrollY = 0;
+
+    if (strategy === 'to_end') {
+      if (direction === 'down') {
+        scrollY = container.scrollHeight - container.clientHeight - container.scrollTop;
+      } else if (direction === 'up') {
+        scrollY = -container.scrollTop;
+      } else if (direction === 'right') {
+        scrollX = container.scrollWidth - container.clientWidth - container.scrollLeft;
+      } else if (direction === 'left') {
+        scrollX = -container.scrollLeft;
+      }
+    } else if (vertical) {
+      scrollY = scrollAmount;
+    } else {
+      scrollX = scrollAmount;
+    }
+
+    const isRoot = isRootScroller(container);
+
+    const scrollOptions = {
+      top: scrollY,
+      left: scrollX,
+      behavior: smooth ? 'smooth' : 'auto'
+    };
+
+    if (isRoot) {
+      window.scrollBy(scrollOptions);
+    } else {
+      container.scrollBy(scrollOptions);
+    }
+
+    return { container, isRoot, targetSelector, scrollX, scrollY };
+  };
+
+  const describeScroll = ({ container, isRoot, targetSelector, scrollX, scrollY }) => {
+    // read each metric once after the scroll, every read can force a layout
+    const { scrollTop, scrollLeft } = container;
+    const maxScrollY = container.scrollHeight - container.clientHeight;
+    const maxScrollX = container.scrollWidth - container.clientWidth;
+    const scrollPercentY = maxScrollY > 0 ? (scrollTop / maxScrollY) * 100 : 0;
+    const scrollPercentX = maxScrollX > 0 ? (scrollLeft / maxScrollX) * 100 : 0;
+
+    let position = '';
+    if (scrollPercentY <= 5) position = 'top';
+    else if (scrollPercentY >= 95) position = 'bottom';
+    else position = 'middle';
+
+    return {
+      // a short label, className can be kilobytes of utility classes
+      container: targetSelector || (isRoot ? 'window' : describeContainer(container)),
+      scrolledX: scrollX,
+      scrolledY: scrollY,
+      newPosition: {
+        x: isRoot ? window.scrollX : scrollLeft,
+        y: isRoot ? window.scrollY : scrollTop
+      },
+      scrollPosition: {
+        percentY: scrollPercentY,
+        percentX: scrollPercentX,
+        position: position
+      },
+      hasMoreContent: {
+        down: scrollTop < maxScrollY - 5,
+        up: scrollTop > 5,
+        right: scrollLeft < maxScrollX - 5,
+        left: scrollLeft > 5
+      }
+    };
+  };
+
+  const enhancedScroll = async (options) => JSON.stringify(describeScroll(startScroll(options)));
+
+  // Runs several scrolls in one call, letting each smooth one finish before reporting on it and starting
+  // the next. Stops at the first failing scroll, the ones before it have already moved the page so their
+  // results are returned along with the error
+  const batchedScroll = async ({ scrolls }) => {
+    const results = [];
+    for (let i = 0; i < scrolls.length; i++) {
+      try {
+        const scroll = startScroll(scrolls[i]);
+        if (scrolls[i].smooth) {
+          await waitForScrollEnd(500);
+        }
+        results.push(describeScroll(scroll));
+      } catch (e) {
+        return JSON.stringify({ results, failedIndex: i, error: e.message });
+      }
+    }
+    return JSON.stringify({ results });
+  };
+
+  // Results are returned as JSON strings: one string transfer is cheaper than having
+  // Playwright serialize every nested field of the result object
+  // Only the topN highest ranked areas are returned, count and summary still cover all of them
+  const detectScrollableAreas = ({ topN = 5 } = {}) => {
+    const scrollableElements = [];
+
+    function hasOverflowingContent(element) {
+      return element.scrollHeight > element.clientHeight || element.scrollWidth > element.clientWidth;
+    }
+
+    function hasScrollableOverflow(element) {
+      const style = window.getComputedStyle(element);
+      // the computed overflow shorthand is derived from these two, no need to check it separately
+      return SCROLLABLE_OVERFLOW.has(style.overflowY) || SCROLLABLE_OVERFLOW.has(style.overflowX);
+    }
+
+    function getElementDescription(element) {
+      let desc = element.tagName.toLowerCase();
+      if (element.id) desc += '#' + element.id;
+      // classList works for SVG elements too (their className is an SVGAnimatedString) and doesn't allocate
+      const classCount = Math.min(3, element.classList.length);
+      for (let i = 0; i < classCount; i++) desc += '.' + element.classList[i];
+
+      const ariaLabel = element.getAttribute('aria-label');
+      if (ariaLabel) desc += ' [' + ariaLabel + ']';
+
+      if (element.classList.contains('scaffold-layout__aside') ||
+        element.tagName === 'FORM' && element.classList.contains('overflow-y-auto')) {
+        desc += ' (Filter Panel)';
+      } else if (element.classList.contains('artdeco-typeahead__results-list')) {
+        desc += ' (Dropdown)';
+      } else if (element.id === 'search-results-container' ||
+           element.classList.contains('search-results')) {
+        desc += ' (Search Results)';
+      }
+
+      return desc;
+    }
+
+    // The set of scrollable elements is reused across calls until the DOM, styles or viewport change.
+    // Positions and scroll offsets change without any of those, so they are always read fresh below
+    let scrollables = containerCache.get('scrollables');
+    if (!scrollables) {
+      // Pass 1: collect candidates on geometry alone. Only elements whose content overflows get a
+      // getComputedStyle call, which is by far the most expensive read here
+      const walker = document.createTreeWalker(document.documentElement, NodeFilter.SHOW_ELEMENT, {
+        acceptNode: element => hasOverflowingContent(element) ? NodeFilter.FILTER_ACCEPT : NodeFilter.FILTER_SKIP
+      });
+      // the walker starts on <html> itself, which the filter doesn't see, everything nextNode()
+      // returns has already passed it
+      const candidates = hasOverflowingContent(walker.currentNode) ? [walker.currentNode] : [];
+      for (let element = walker.nextNode(); element; element = walker.nextNode()) {
+        candidates.push(element);
+      }
+      // Pass 2: style reads, only for the candidates and back to back
+      scrollables = candidates.filter(hasScrollableOverflow);
+      containerCache.set('scrollables', scrollables);
+    }
+
+    // summarized while building the entries instead of walking them again with some/filter
+    const summary = { hasFilterPanel: false, hasDropdown: false, visibleScrollables: 0 };
+
+    // Only rects and class flags are needed to rank and summarize every element, the full
+    // description (selector, scroll position, labels) is built for the listed ones only
+    for (let i = 0, n = scrollables.length; i < n; i++) {
+      const element = scrollables[i];
+      const rect = element.getBoundingClientRect();
+      const isVisible = rect.width > 0 && rect.height > 0 &&
+        rect.top < window.innerHeight &&
+        rect.bottom > 0;
+
+      const isFilterPanel = element.classList.contains('scaffold-layout__aside') ||
+        element.classList.contains('search-filters-panel');
+      const isDropdown = element.classList.contains('artdeco-typeahead__results-list') ||
+        element.classList.contains('typeahead-results');
+      if (isFilterPanel) summary.hasFilterPanel = true;
+      if (isDropdown) summary.hasDropdown = true;
+      if (isVisible) summary.visibleScrollables++;
+
+      scrollableElements.push({ element, rect, isVisible, isFilterPanel, isDropdown });
+    }
+
+    // visible first, then largest first
+    const compare = (a, b) => {
+      if (a.isVisible !== b.isVisible) return b.isVisible ? 1 : -1;
+      return (b.rect.width * b.rect.height) - (a.rect.width * a.rect.height);
+    };
+
+    // Only the top entries are listed, keep a small sorted array instead of sorting and shipping everything
+    const top = [];
+    for (const entry of scrollableElements) {
+      if (top.length === topN && compare(entry, top[top.length - 1]) >= 0) {
+        continue;
+      }
+      let i = top.length;
+      while (i > 0 && compare(entry, top[i - 1]) < 0) {
+        i--;
+      }
+      top.splice(i, 0, entry);
+      if (top.length > topN) {
+        top.pop();
+      }
+    }
+
+    const describe = ({ element, rect, isVisible, isFilterPanel, isDropdown }) => {
+      const maxScroll = element.scrollHeight - element.clientHeight;
+      const scrollPercent = maxScroll > 0 ? (element.scrollTop / maxScroll) * 100 : 0;
+      let position = '';
+      if (scrollPercent <= 5) position = 'top';
+      else if (scrollPercent >= 95) position = 'bottom';
+      else position = 'middle';
+
+      // escaped so the selector can be passed back as target_selector/container_selector
+      const elementSelector = element.tagName.toLowerCase() +
+        (element.id ? '#' + CSS.escape(element.id) : '') +
+        (element.classList.length ? '.' + CSS.escape(element.classList[0]) : '');
+
+      return {
+        description: getElementDescription(element),
+        selector: elementSelector,
+        dimensions: {
+          width: rect.width,
+          height: rect.height,
+          top: rect.top,
+          left: rect.left
+        },
+        scrollInfo: {
+          scrollHeight: element.scrollHeight,
+          clientHeight: element.clientHeight,
+          scrollTop: element.scrollTop,
+          canScrollDown: element.scrollTop < (element.scrollHeight - element.clientHeight - 5),
+          canScrollUp: element.scrollTop > 5,
+          scrollablePixels: element.scrollHeight - element.clientHeight,
+          scrollPercent: scrollPercent,
+          position: position
+        },
+        isVisible: isVisible,
+        isFilterPanel: isFilterPanel,
+        isDropdown: isDropdown
+      };
+    };
+
+    return JSON.stringify({
+      count: scrollableElements.length,
+      elements: top.map(describe),
+      summary: summary
+    });
+  };
+
+  const scrollToElement = async (options) => {
+    const { selector, alignment, smooth } = options;
+    const element = document.querySelector(selector);
+
+    if (!element) {
+      throw new Error('Element not found: ' + selector);
+    }
+
+    const beforeRect = element.getBoundingClientRect();
+    const wasVisible = beforeRect.top >= 0 &&
+             beforeRect.bottom <= window.innerHeight;
+
+    element.scrollIntoView({
+      behavior: smooth ? 'smooth' : 'auto',
+      block: alignment,
+      inline: 'nearest'
+    });
+
+    // an instant scrollIntoView has already moved everything, only smooth scrolling needs a wait
+    if (smooth) {
+      await waitForScrollEnd(500);
+    }
+
+    const afterRect = element.getBoundingClientRect();
+    return {
+      element: selector,
+      wasVisible: wasVisible,
+      isNowVisible: afterRect.top >= 0 && afterRect.bottom <= window.innerHeight,
+      position: {
+        top: afterRect.top,
+        bottom: afterRect.bottom,
+        left: afterRect.left,
+        right: afterRect.right
+      }
+    };
+  };
+
+  const scrollUntilVisible = async (options) => {
+    const { text, maxScrolls, scrollAmount, containerSelector } = options;
+
+    const container = findScrollContainer(containerSelector, 'any');
+
+    const isRoot = isRootScroller(container);
+
+    let scrollCount = 0;
+    let found = false;
+    let foundElement = null;
+
+    const lowerText = text.toLowerCase();
+
+    // Cheap negative check: a text node can only match if the whole text of the body does, and most
+    // searches run while the text isn't on the page at all. It builds a copy of the whole document text,
+    // so it is done at most once per scroll step (again only if the DOM changed since)
+    const textOnPage = () => document.body.textContent.toLowerCase().includes(lowerText);
+
+    const findVisibleText = () => {
+      const walker = document.createTreeWalker(
+        document.body,
+        NodeFilter.SHOW_TEXT,
+        null,
+        false
+      );
+
+      let node;
+      while (node = walker.nextNode()) {
+        if (node.nodeValue.toLowerCase().includes(lowerText)) {
+          const element = node.parentElement;
+          const rect = element.getBoundingClientRect();
+          if (rect.width > 0 && rect.height > 0 &&
+            rect.top >= 0 && rect.bottom <= window.innerHeight) {
+            foundElement = element;
+            return true;
+          }
+        }
+      }
+      return false;
+    };
+
+    if (textOnPage() && findVisibleText()) {
+      return JSON.stringify({
+        found: true,
+        scrollCount: 0,
+        message: 'Text "' + text + '" is already visible'
+      });
+    }
+
+    while (scrollCount < maxScrolls && !found) {
+      const oldScrollTop = isRoot ? window.scrollY : container.scrollTop;
+
+      if (isRoot) {
+        window.scrollBy(0, scrollAmount);
+      } else {
+        container.scrollBy(0, scrollAmount);
+      }
+
+      scrollCount++;
+
+      // two frames are enough for the scrolled-in content to be laid out and painted
+      await nextFrame();
+      await nextFrame();
+      let onPage = textOnPage();
+      if (onPage && findVisibleText()) {
+        found = true;
+        break;
+      }
+
+      const getScrollTop = () => isRoot ? window.scrollY : container.scrollTop;
+      if (getScrollTop() === oldScrollTop) {
+        // only wait longer when nothing moved, smooth scrolling or lazy content may still be catching up
+        if (await waitForMutation(500)) {
+          onPage = textOnPage();
+        }
+        if (onPage && findVisibleText()) {
+          found = true;
+          break;
+        }
+        if (getScrollTop() === oldScrollTop) {
+          break;
+        }
+      }
+    }
+
+    return JSON.stringify({
+      found: found,
+      scrollCount: scrollCount,
+      message: found ?
+        'Found "' + text + '" after ' + scrollCount + ' scrolls' :
+        'Text "' + text + '" not found after ' + scrollCount + ' scrolls'
+    });
+  };
+
+  // The whole scroll/wait/measure loop runs in the page, so a session costs one round-trip.
+  // Instead of always sleeping waitTime, each wait ends once newly added nodes have settled,
+  // waitTime is only the upper bound, and it is halved after every scroll that loaded nothing.
+  const infiniteScroll = async (options) => {
+    const { maxItems, maxScrolls, waitTime, itemSelector } = options;
+
+    const countItems = () => itemSelector ? document.querySelectorAll(itemSelector).length : 0;
+
+    // Resolves as soon as more items match itemSelector, or else once mutations have settled for
+    // 250ms, and at the latest after maxWait
+    const waitForNewContent = (maxWait, itemsBefore) => new Promise(resolve => {
+      let settleTimer = null;
+      let deadline = null;
+      const observer = new MutationObserver(() => {
+        if (itemSelector && countItems() > itemsBefore) {
+          finish();
+          return;
+        }
+        clearTimeout(settleTimer);
+        settleTimer = setTimeout(finish, 250);
+      });
+      const finish = () => {
+        observer.disconnect();
+        clearTimeout(settleTimer);
+        clearTimeout(deadline);
+        resolve();
+      };
+      observer.observe(document.body, { childList: true, subtree: true });
+      deadline = setTimeout(finish, maxWait);
+    });
+
+    const initialCount = countItems();
+    let itemCount = initialCount;
+    let lastHeight = document.body.scrollHeight;
+    let scrollCount = 0;
+    let noNewContentCount = 0;
+    let maxWait = waitTime * 1000;
+
+    while (scrollCount < maxScrolls) {
+      // counts resources finishing during the wait. Unlike the resource timing buffer (250 entries
+      // by default) an observer isn't capped, so this keeps working on long sessions
+      let resourcesLoaded = 0;
+      const resourceObserver = new PerformanceObserver(list => { resourcesLoaded += list.getEntries().length; });
+      resourceObserver.observe({ type: 'resource' });
+
+      window.scrollTo(0, document.body.scrollHeight);
+      await waitForNewContent(maxWait, itemCount);
+
+      resourcesLoaded += resourceObserver.takeRecords().length;
+      resourceObserver.disconnect();
+      itemCount = countItems();
+
+      if (itemSelector && maxItems && itemCount >= maxItems) {
+        return { initialCount, finalCount: itemCount, scrollCount, reachedLimit: true };
+      }
+
+      const newHeight = document.body.scrollHeight;
+      if (newHeight === lastHeight) {
+        noNewContentCount++;
+        // nothing grew and nothing loaded while we waited: the feed has ended, no need to confirm it.
+        // Requests that finished without adding content keep the usual three strikes
+        if (noNewContentCount >= 3 || resourcesLoaded === 0) {
+          break;
+        }
+        // the feed has probably ended, back off the wait while confirming it
+        maxWait /= 2;
+      } else {
+        noNewContentCount = 0;
+        lastHeight = newHeight;
+        maxWait = waitTime * 1000;
+      }
+
+      scrollCount++;
+    }
+
+    return { initialCount, finalCount: itemCount, scrollCount, reachedLimit: false };
+  };
+
+  const smartScrollToFind = async (options) => {
+    const { text, containerSelector, maxScrollsPerDirection, scrollAmount } = options;
+
+    const container = findScrollContainer(containerSelector, 'any');
+
+    const isRoot = isRootScroller(container);
+
+    const searchForText = () => {
+      const walker = document.createTreeWalker(
+        container || document.body,
+        NodeFilter.SHOW_TEXT,
+        null,
+        false
+      );
+
+      let node;
+      while (node = walker.nextNode()) {
+        const nodeText = node.nodeValue.trim();
+        if (nodeText && nodeText.toLowerCase().includes(text.toLowerCase())) {
+          const element = node.parentElement;
+          if (element) {
+            const rect = element.getBoundingClientRect();
+            if (rect.width > 0 && rect.height > 0 &&
+              rect.top >= -10 && rect.bottom <= window.innerHeight + 10 &&
+              rect.left >= -10 && rect.right <= window.innerWidth + 10) {
+              return true;
+            }
+          }
+        }
+      }
+
+      const elements = (container || document).querySelectorAll('button, a, [aria-label], [role="button"]');
+      for (const el of elements) {
+        const elementText = (el.textContent || '').trim();
+        const ariaLabel = el.getAttribute('aria-label') || '';
+        const combinedText = elementText + ' ' + ariaLabel;
+
+        if (combinedText.toLowerCase().includes(text.toLowerCase())) {
+          const rect = el.getBoundingClientRect();
+          if (rect.width > 0 && rect.height > 0 &&
+            rect.top >= -10 && rect.bottom <= window.innerHeight + 10 &&
+            rect.left >= -10 && rect.right <= window.innerWidth + 10) {
+            return true;
+          }
+        }
+      }
+
+      return false;
+    };
+
+    if (searchForText()) {
+      return {
+        found: true,
+        direction: 'none',
+        scrollCount: 0,
+        message: 'Text "' + text + '" is already visible'
+      };
+    }
+
+    const scrollTop = isRoot ? window.scrollY : container.scrollTop;
+    const maxScroll = container.scrollHeight - container.clientHeight;
+    const scrollPercent = maxScroll > 0 ? (scrollTop / maxScroll) * 100 : 0;
+
+    // Use pattern hint if provided
+    let directions = [];
+    if (options.patternHint) {
+      const hint = options.patternHint;
+      if (hint.start_position === 'bottom' && scrollPercent < 50) {
+        // Jump to bottom first if pattern suggests it
+        if (isRoot) {
+          window.scrollTo(0, maxScroll);
+        } else {
+          container.scrollTop = maxScroll;
+        }
+        await new Promise(r => setTimeout(r, 500));
+        directions = ['up', 'down'];
+      } else if (hint.preferred === 'down') {
+        directions = ['down', 'up'];
+      } else {
+        directions = ['up', 'down'];
+      }
+    } else {
+      // Default behavior based on current position
+      if (scrollPercent >= 90) {
+        directions = ['up', 'down'];
+      } else if (scrollPercent <= 10) {
+        directions = ['down', 'up'];
+      } else {
+        directions = ['down', 'up'];
+      }
+    }
+
+    const results = {
+      found: false,
+      direction: 'none',
+      scrollCount: 0,
+      triedDirections: [],
+      initialPosition: scrollPercent
+    };
+
+    for (const direction of directions) {
+      results.triedDirections.push(direction);
+
+      if (results.triedDirections.length > 1) {
+        if (isRoot) {
+          window.scrollTo(0, scrollTop);
+        } else {
+          container.scrollTop = scrollTop;
+        }
+        await new Promise(r => setTimeout(r, 100));
+      }
+
+      const scrollStep = direction === 'up' ? -scrollAmount : scrollAmount;
+      let scrollsInDirection = 0;
+
+      while (scrollsInDirection < maxScrollsPerDirection) {
+        const oldScroll = isRoot ? window.scrollY : container.scrollTop;
+
+        if (isRoot) {
+          window.scrollBy(0, scrollStep);
+        } else {
+          container.scrollBy(0, scrollStep);
+        }
+
+        await new Promise(r => setTimeout(r, 300));
+        scrollsInDirection++;
+        results.scrollCount++;
+
+        if (searchForText()) {
+          results.found = true;
+          results.direction = direction;
+          return results;
+        }
+
+        const newScroll = isRoot ? window.scrollY : container.scrollTop;
+        if ((direction === 'up' && newScroll <= 5) ||
+          (direction === 'down' && newScroll >= maxScroll - 5)) {
+          break;
+        }
+      }
+    }
+
+    return results;
+  };
+
+  window.__buScroll = {
+    enhancedScroll,
+    batchedScroll,
+    detectScrollableAreas,
+    scrollToElement,
+    scrollUntilVisible,
+    infiniteScroll,
+    smartScrollToFind
+  };
+})()
@@ -4,19 +4,45 @@ Provides advanced scrolling capabilities including container detection,
 directional scrolling, and content search while scrolling.
 """
 
-import asyncio
+import json
 import logging
-from typing import Optional, Union
+import weakref
 from enum import Enum
+from importlib import resources
+from typing import Any, Optional, Union
 
 from pydantic import BaseModel, Field
-from playwright.async_api import Page
+from playwright.async_api import BrowserContext, Page
 
 from browser_use.browser import BrowserSession
 from browser_use.controller.service import Controller, ActionResult
 
 logger = logging.getLogger(__name__)
 
+# Page-side half of these actions, installs the helpers on window.__buScroll (see enhanced_scroll.js)
+_SCROLL_HELPERS_JS = resources.files('browser_use.controller.actions').joinpath('enhanced_scroll.js').read_text()
+
+# Calls one helper by name, null means the current document doesn't have the helpers yet
+_CALL_SCROLL_HELPER_JS = "([name, options]) => window.__buScroll ? window.__buScroll[name](options) : null"
+
+
+# Browser contexts that already have the helpers registered as an init script
+_contexts_with_helpers: "weakref.WeakSet[BrowserContext]" = weakref.WeakSet()
+
+
+async def _run_scroll_helper(page: Page, name: str, options: Optional[dict] = None) -> Any:
+    """Run one of the window.__buScroll helpers, installing them first if the page navigated since the last call"""
+    if page.context not in _contexts_with_helpers:
+        # documents loaded from now on get the helpers at document start, so later calls skip the install round-trip
+        _contexts_with_helpers.add(page.context)
+        await page.context.add_init_script(_SCROLL_HELPERS_JS)
+
+    result = await page.evaluate(_CALL_SCROLL_HELPER_JS, [name, options])
+    if result is None:
+        await page.evaluate(_SCROLL_HELPERS_JS)
+        result = await page.evaluate(_CALL_SCROLL_HELPER_JS, [name, options])
+    return result
+
 
 class ScrollDirection(str, Enum):
     """Scrolling directions"""
@@ -54,6 +80,16 @@ class EnhancedScrollAction(BaseModel):
     smooth: bool = Field(default=False, description="Use smooth scrolling animation")
 
 
+class BatchedScrollAction(BaseModel):
+    """Parameters for running several scrolls in one go"""
+    scrolls: list[EnhancedScrollAction] = Field(min_length=1, description="Scrolls to perform, in order")
+
+
+class DetectScrollableAreasAction(BaseModel):
+    """Parameters for detecting scrollable areas"""
+    top_n: int = Field(default=5, ge=1, description="Number of scrollable areas to list, visible and largest first")
+
+
 class ScrollToElementAction(BaseModel):
     """Parameters for scrolling to a specific element"""
     selector: str = Field(description="CSS selector of the element to scroll to")
@@ -73,7 +109,7 @@ class InfiniteScrollAction(BaseModel):
     """Parameters for handling infinite scroll pages"""
     max_items: Optional[int] = Field(default=None, description="Maximum items to load (default: no limit)")
     max_scrolls: int = Field(default=20, description="Maximum scroll attempts")
-    wait_time: float = Field(default=2.0, description="Seconds to wait for new content after each scroll")
+    wait_time: float = Field(default=2.0, description="Maximum seconds to wait for new content after each scroll")
     item_selector: Optional[str] = Field(default=None, description="CSS selector to count loaded items")
 
 
@@ -85,6 +121,46 @@ class SmartScrollToFindAction(BaseModel):
     scroll_amount: int = Field(default=400, description="Pixels to scroll each attempt")
 
 
+def _scroll_options(params: EnhancedScrollAction) -> dict:
+    """Options for the enhancedScroll page helper"""
+    return {
+        "direction": params.direction.value,
+        "amount": params.amount,
+        "strategy": params.strategy.value,
+        "targetSelector": params.target_selector,
+        "smooth": params.smooth
+    }
+
+
+def _describe_scroll(params: EnhancedScrollAction, result: dict) -> str:
+    """Describe one enhancedScroll result: what moved, where it ended up and what is left to scroll"""
+    strategy_str = f" using {params.strategy.value} strategy" if params.strategy != ScrollStrategy.PIXELS else ""
+    target_str = f" in {result['container']}" if params.target_selector else ""
+    amount_str = f"{abs(result['scrolledY'] or result['scrolledX'])} pixels"
+    
+    msg = f"Scrolled {params.direction.value}{target_str} by {amount_str}{strategy_str}"
+    
+    if params.strategy == ScrollStrategy.TO_END:
+        msg = f"Scrolled to the {params.direction.value}{target_str}"
+    
+    # Add position and content info
+    position_info = result.get('scrollPosition', {})
+    if position_info.get('position'):
+        msg += f" - now at {position_info['position']} ({position_info['percentY']:.0f}%)"
+    
+    more_content = []
+    for direction, has_more in result['hasMoreContent'].items():
+        if has_more:
+            more_content.append(direction)
+    
+    if more_content:
+        msg += f" (can scroll: {', '.join(more_content)})"
+    else:
+        msg += " (reached scroll limits)"
+    
+    return msg
+
+
 def register_enhanced_scroll_actions(controller: Controller) -> None:
     """Register all enhanced scrolling actions with the controller"""
     
@@ -102,176 +178,9 @@ def register_enhanced_scroll_actions(controller: Controller) -> None:
         page = await browser_session.get_current_page()
         
         try:
-            # Calculate scroll amount based on strategy
-            if params.strategy == ScrollStrategy.VIEWPORT:
-                viewport_width = await page.evaluate("window.innerWidth")
-                viewport_height = await page.evaluate("window.innerHeight")
-                if params.direction in [ScrollDirection.UP, ScrollDirection.DOWN]:
-                    amount = viewport_height * (params.amount or 100) / 100
-                else:
-                    amount = viewport_width * (params.amount or 100) / 100
-            elif params.strategy == ScrollStrategy.PAGE:
-                viewport_width = await page.evaluate("window.innerWidth")
-                viewport_height = await page.evaluate("window.innerHeight")
-                if params.direction in [ScrollDirection.UP, ScrollDirection.DOWN]:
-                    amount = viewport_height
-                else:
-                    amount = viewport_width
-            elif params.strategy == ScrollStrategy.TO_END:
-                # Will be handled in the JavaScript
-                amount = 0
-            else:  # PIXELS
-                amount = params.amount or 300
-            
-            # Apply direction
-            if params.direction in [ScrollDirection.UP, ScrollDirection.LEFT]:
-                amount = -amount
-            
-            # JavaScript for enhanced scrolling
-            js_code = """
-            async (options) => {
-                const { direction, amount, strategy, targetSelector, smooth } = options;
-                
-                let container = null;
-                
-                if (targetSelector) {
-                    container = document.querySelector(targetSelector);
-                    if (!container) {
-                        throw new Error('Container not found: ' + targetSelector);
-                    }
-                } else {
-                    const isFilterPanel = el => 
-                        el.tagName === 'FORM' || 
-                        el.classList.contains('overflow-y-auto') ||
-                        el.classList.contains('scaffold-layout__aside') ||
-                        el.querySelector('[aria-label*="filter"]');
-                    
-                    const isMainContent = el =>
-                        el.id === 'search-results-container' ||
-                        el.classList.contains('search-results') ||
-                        el.classList.contains('main-content') ||
-                        el.querySelector('[data-test*="search-result"]');
-                    
-                    const bigEnough = el => el.clientHeight >= window.innerHeight * 0.5;
-                    const canScroll = el =>
-                        el &&
-                        /(auto|scroll|overlay)/.test(getComputedStyle(el).overflowY) &&
-                        el.scrollHeight > el.clientHeight;
-                    
-                    let mainContent = [...document.querySelectorAll('*')].find(el => 
-                        isMainContent(el) && canScroll(el) && bigEnough(el)
-                    );
-                    
-                    if (mainContent) {
-                        container = mainContent;
-                    } else {
-                        container = document.scrollingElement || document.documentElement;
-                    }
-                }
-                
-                let scrollX = 0, scrollY = 0;
-                
-                if (strategy === 'to_end') {
-                    if (direction === 'down') {
-                        scrollY = container.scrollHeight - container.clientHeight - container.scrollTop;
-                    } else if (direction === 'up') {
-                        scrollY = -container.scrollTop;
-                    } else if (direction === 'right') {
-                        scrollX = container.scrollWidth - container.clientWidth - container.scrollLeft;
-                    } else if (direction === 'left') {
-                        scrollX = -container.scrollLeft;
-                    }
-                } else {
-                    if (direction === 'down') scrollY = amount;
-                    else if (direction === 'up') scrollY = amount;
-                    else if (direction === 'right') scrollX = amount;
-                    else if (direction === 'left') scrollX = amount;
-                }
-                
-                const isRoot = container === document.scrollingElement || 
-                              container === document.documentElement || 
-                              container === document.body;
-                
-                const scrollOptions = {
-                    top: scrollY,
-                    left: scrollX,
-                    behavior: smooth ? 'smooth' : 'auto'
-                };
-                
-                if (isRoot) {
-                    window.scrollBy(scrollOptions);
-                } else {
-                    container.scrollBy(scrollOptions);
-                }
-                
-                const maxScrollY = container.scrollHeight - container.clientHeight;
-                const maxScrollX = container.scrollWidth - container.clientWidth;
-                const scrollPercentY = maxScrollY > 0 ? (container.scrollTop / maxScrollY) * 100 : 0;
-                const scrollPercentX = maxScrollX > 0 ? (container.scrollLeft / maxScrollX) * 100 : 0;
-                
-                let position = '';
-                if (scrollPercentY <= 5) position = 'top';
-                else if (scrollPercentY >= 95) position = 'bottom';
-                else position = 'middle';
-                
-                return {
-                    container: targetSelector || (isRoot ? 'window' : container.className || container.tagName),
-                    scrolledX: scrollX,
-                    scrolledY: scrollY,
-                    newPosition: {
-                        x: isRoot ? window.scrollX : container.scrollLeft,
-                        y: isRoot ? window.scrollY : container.scrollTop
-                    },
-                    scrollPosition: {
-                        percentY: scrollPercentY,
-                        percentX: scrollPercentX,
-                        position: position
-                    },
-                    hasMoreContent: {
-                        down: container.scrollTop < (container.scrollHeight - container.clientHeight - 5),
-                        up: container.scrollTop > 5,
-                        right: container.scrollLeft < (container.scrollWidth - container.clientWidth - 5),
-                        left: container.scrollLeft > 5
-                    }
-                };
-            }
-            """
-            
-            options = {
-                "direction": params.direction.value,
-                "amount": amount,
-                "strategy": params.strategy.value,
-                "targetSelector": params.target_selector,
-                "smooth": params.smooth
-            }
-            
-            result = await page.evaluate(js_code, options)
-            
-            # Build message
-            strategy_str = f" using {params.strategy.value} strategy" if params.strategy != ScrollStrategy.PIXELS else ""
-            target_str = f" in {result['container']}" if params.target_selector else ""
-            amount_str = f"{abs(result['scrolledY'] or result['scrolledX'])} pixels"
-            
-            msg = f"🔍 Scrolled {params.direction.value}{target_str} by {amount_str}{strategy_str}"
-            
-            if params.strategy == ScrollStrategy.TO_END:
-                msg = f"🔍 Scrolled to the {params.direction.value}{target_str}"
-            
-            # Add position and content info
-            position_info = result.get('scrollPosition', {})
-            if position_info.get('position'):
-                msg += f" - now at {position_info['position']} ({position_info['percentY']:.0f}%)"
-            
-            more_content = []
-            for direction, has_more in result['hasMoreContent'].items():
-                if has_more:
-                    more_content.append(direction)
-            
-            if more_content:
-                msg += f" (can scroll: {', '.join(more_content)})"
-            else:
-                msg += " (reached scroll limits)"
+            result = json.loads(await _run_scroll_helper(page, 'enhancedScroll', _scroll_options(params)))
             
+            msg = f"🔍 {_describe_scroll(params, result)}"
             logger.info(msg)
             return ActionResult(
                 data=result,
@@ -284,10 +193,49 @@ def register_enhanced_scroll_actions(controller: Controller) -> None:
             logger.error(error_msg)
             return ActionResult(error=error_msg, include_in_memory=True)
     
+    @controller.action(
+        description="Perform several enhanced scrolls in a row with a single page call",
+        param_model=BatchedScrollAction
+    )
+    async def batched_scroll(params: BatchedScrollAction, browser_session: BrowserSession) -> ActionResult:
+        """Runs a sequence of enhanced scrolls in one round-trip to the page"""
+        page = await browser_session.get_current_page()
+        
+        try:
+            options = {"scrolls": [_scroll_options(scroll) for scroll in params.scrolls]}
+            result = json.loads(await _run_scroll_helper(page, 'batchedScroll', options))
+            results = result['results']
+            
+            scroll_lines = [
+                f"{i+1}. {_describe_scroll(scroll, scroll_result)}"
+                for i, (scroll, scroll_result) in enumerate(zip(params.scrolls, results))
+            ]
+            
+            if 'error' in result:
+                # the scrolls before the failing one did move the page, say so
+                error_msg = f"Failed to perform batched scroll: scroll {result['failedIndex'] + 1} failed: {result['error']}"
+                if scroll_lines:
+                    error_msg += f"\nCompleted {len(scroll_lines)} scrolls before it:\n" + "\n".join(scroll_lines)
+                logger.error(error_msg)
+                return ActionResult(error=error_msg, include_in_memory=True)
+            
+            msg = "\n".join([f"🔍 Performed {len(results)} scrolls", *scroll_lines])
+            logger.info(msg)
+            return ActionResult(
+                extracted_content=msg,
+                include_in_memory=True
+            )
+            
+        except Exception as e:
+            error_msg = f"Failed to perform batched scroll: {str(e)}"
+            logger.error(error_msg)
+            return ActionResult(error=error_msg, include_in_memory=True)
+    
     @controller.action(
         description="Detect all scrollable areas on the page",
+        param_model=DetectScrollableAreasAction
     )
-    async def detect_scrollable_areas(browser_session: BrowserSession) -> ActionResult:
+    async def detect_scrollable_areas(params: DetectScrollableAreasAction, browser_session: BrowserSession) -> ActionResult:
         """
         Detects and returns information about all scrollable areas on the page.
         Useful for understanding page structure before scrolling.
@@ -295,116 +243,7 @@ def register_enhanced_scroll_actions(controller: Controller) -> None:
         page = await browser_session.get_current_page()
         
         try:
-            js_code = """
-            () => {
-                const scrollableElements = [];
-                
-                function isScrollable(element) {
-                    const style = window.getComputedStyle(element);
-                    const overflowY = style.overflowY;
-                    const overflowX = style.overflowX;
-                    const overflow = style.overflow;
-                    
-                    const hasScrollableOverflow = 
-                        /(auto|scroll|overlay)/.test(overflowY) ||
-                        /(auto|scroll|overlay)/.test(overflowX) ||
-                        /(auto|scroll|overlay)/.test(overflow);
-                    
-                    const canScrollVertically = element.scrollHeight > element.clientHeight;
-                    const canScrollHorizontally = element.scrollWidth > element.clientWidth;
-                    
-                    return hasScrollableOverflow && (canScrollVertically || canScrollHorizontally);
-                }
-                
-                function getElementDescription(element) {
-                    let desc = element.tagName.toLowerCase();
-                    if (element.id) desc += '#' + element.id;
-                    if (element.className) {
-                        const classes = element.className.toString().split(' ').filter(c => c).slice(0, 3);
-                        if (classes.length) desc += '.' + classes.join('.');
-                    }
-                    
-                    const ariaLabel = element.getAttribute('aria-label');
-                    if (ariaLabel) desc += ' [' + ariaLabel + ']';
-                    
-                    if (element.classList.contains('scaffold-layout__aside') || 
-                        element.tagName === 'FORM' && element.classList.contains('overflow-y-auto')) {
-                        desc += ' (Filter Panel)';
-                    } else if (element.classList.contains('artdeco-typeahead__results-list')) {
-                        desc += ' (Dropdown)';
-                    } else if (element.id === 'search-results-container' || 
-                               element.classList.contains('search-results')) {
-                        desc += ' (Search Results)';
-                    }
-                    
-                    return desc;
-                }
-                
-                const allElements = document.querySelectorAll('*');
-                for (const element of allElements) {
-                    if (isScrollable(element)) {
-                        const rect = element.getBoundingClientRect();
-                        const isVisible = rect.width > 0 && rect.height > 0 && 
-                                        rect.top < window.innerHeight && 
-                                        rect.bottom > 0;
-                        
-                        const maxScroll = element.scrollHeight - element.clientHeight;
-                        const scrollPercent = maxScroll > 0 ? (element.scrollTop / maxScroll) * 100 : 0;
-                        let position = '';
-                        if (scrollPercent <= 5) position = 'top';
-                        else if (scrollPercent >= 95) position = 'bottom';
-                        else position = 'middle';
-                        
-                        const elementSelector = element.tagName.toLowerCase() + 
-                                               (element.id ? '#' + element.id : '') + 
-                                               (element.className ? '.' + element.className.toString().split(' ')[0] : '');
-                        
-                        scrollableElements.push({
-                            description: getElementDescription(element),
-                            selector: elementSelector,
-                            dimensions: {
-                                width: rect.width,
-                                height: rect.height,
-                                top: rect.top,
-                                left: rect.left
-                            },
-                            scrollInfo: {
-                                scrollHeight: element.scrollHeight,
-                                clientHeight: element.clientHeight,
-                                scrollTop: element.scrollTop,
-                                canScrollDown: element.scrollTop < (element.scrollHeight - element.clientHeight - 5),
-                                canScrollUp: element.scrollTop > 5,
-                                scrollablePixels: element.scrollHeight - element.clientHeight,
-                                scrollPercent: scrollPercent,
-                                position: position
-                            },
-                            isVisible: isVisible,
-                            isFilterPanel: element.classList.contains('scaffold-layout__aside') ||
-                                         element.classList.contains('search-filters-panel'),
-                            isDropdown: element.classList.contains('artdeco-typeahead__results-list') ||
-                                      element.classList.contains('typeahead-results')
-                        });
-                    }
-                }
-                
-                scrollableElements.sort((a, b) => {
-                    if (a.isVisible !== b.isVisible) return b.isVisible ? 1 : -1;
-                    return (b.dimensions.width * b.dimensions.height) - (a.dimensions.width * a.dimensions.height);
-                });
-                
-                return {
-                    count: scrollableElements.length,
-                    elements: scrollableElements,
-                    summary: {
-                        hasFilterPanel: scrollableElements.some(e => e.isFilterPanel),
-                        hasDropdown: scrollableElements.some(e => e.isDropdown),
-                        visibleScrollables: scrollableElements.filter(e => e.isVisible).length
-                    }
-                };
-            }
-            """
-            
-            result = await page.evaluate(js_code)
+            result = json.loads(await _run_scroll_helper(page, 'detectScrollableAreas', {"topN": params.top_n}))
             
             # Build helpful message
             msg_parts = [f"Found {result['count']} scrollable areas on the page"]
@@ -418,7 +257,7 @@ def register_enhanced_scroll_actions(controller: Controller) -> None:
             msg_parts.append(f"\nVisible scrollable areas: {result['summary']['visibleScrollables']}")
             
             # List key scrollable areas
-            for i, elem in enumerate(result['elements'][:5]):  # Top 5
+            for i, elem in enumerate(result['elements']):  # already ranked and cut to top_n in the page
                 if elem['isVisible']:
                     scroll_status = []
                     scroll_info = elem['scrollInfo']
@@ -432,12 +271,12 @@ def register_enhanced_scroll_actions(controller: Controller) -> None:
                         scroll_status.append("↑ up")
                     
                     status = f"{pos_str}, can scroll: {', '.join(scroll_status)}" if scroll_status else f"{pos_str} (at limits)"
-                    msg_parts.append(f"\n{i+1}. {elem['description']} - {status}")
+                    # the selector is escaped in the page, so it can be passed back as target_selector
+                    msg_parts.append(f"\n{i+1}. {elem['description']} - {status} (selector: {elem['selector']})")
             
             msg = "\n".join(msg_parts)
             logger.info(msg)
             return ActionResult(
-                data=result,
                 extracted_content=msg,
                 include_in_memory=True
             )
@@ -456,51 +295,13 @@ def register_enhanced_scroll_actions(controller: Controller) -> None:
         page = await browser_session.get_current_page()
         
         try:
-            js_code = """
-            (options) => {
-                const { selector, alignment, smooth } = options;
-                const element = document.querySelector(selector);
-                
-                if (!element) {
-                    throw new Error('Element not found: ' + selector);
-                }
-                
-                const beforeRect = element.getBoundingClientRect();
-                const wasVisible = beforeRect.top >= 0 && 
-                                  beforeRect.bottom <= window.innerHeight;
-                
-                element.scrollIntoView({
-                    behavior: smooth ? 'smooth' : 'auto',
-                    block: alignment,
-                    inline: 'nearest'
-                });
-                
-                return new Promise(resolve => {
-                    setTimeout(() => {
-                        const afterRect = element.getBoundingClientRect();
-                        resolve({
-                            element: selector,
-                            wasVisible: wasVisible,
-                            isNowVisible: afterRect.top >= 0 && afterRect.bottom <= window.innerHeight,
-                            position: {
-                                top: afterRect.top,
-                                bottom: afterRect.bottom,
-                                left: afterRect.left,
-                                right: afterRect.right
-                            }
-                        });
-                    }, smooth ? 500 : 50);
-                });
-            }
-            """
-            
             options = {
                 "selector": params.selector,
                 "alignment": params.alignment,
                 "smooth": params.smooth
             }
             
-            result = await page.evaluate(js_code, options)
+            result = await _run_scroll_helper(page, 'scrollToElement', options)
             
             if result['wasVisible']:
                 msg = f"🎯 Element '{params.selector}' was already visible"
@@ -528,102 +329,6 @@ def register_enhanced_scroll_actions(controller: Controller) -> None:
         page = await browser_session.get_current_page()
         
         try:
-            js_code = """
-            async (options) => {
-                const { text, maxScrolls, scrollAmount, containerSelector } = options;
-                
-                let container = null;
-                if (containerSelector) {
-                    container = document.querySelector(containerSelector);
-                    if (!container) {
-                        throw new Error('Container not found: ' + containerSelector);
-                    }
-                } else {
-                    const bigEnough = el => el.clientHeight >= window.innerHeight * 0.5;
-                    const canScroll = el =>
-                        el &&
-                        /(auto|scroll|overlay)/.test(getComputedStyle(el).overflowY) &&
-                        el.scrollHeight > el.clientHeight &&
-                        bigEnough(el);
-                    
-                    container = [...document.querySelectorAll('*')].find(canScroll)
-                        || document.scrollingElement
-                        || document.documentElement;
-                }
-                
-                const isRoot = container === document.scrollingElement || 
-                              container === document.documentElement || 
-                              container === document.body;
-                
-                let scrollCount = 0;
-                let found = false;
-                let foundElement = null;
-                
-                const searchForText = () => {
-                    const walker = document.createTreeWalker(
-                        document.body,
-                        NodeFilter.SHOW_TEXT,
-                        null,
-                        false
-                    );
-                    
-                    let node;
-                    while (node = walker.nextNode()) {
-                        if (node.nodeValue.toLowerCase().includes(text.toLowerCase())) {
-                            const element = node.parentElement;
-                            const rect = element.getBoundingClientRect();
-                            if (rect.width > 0 && rect.height > 0 && 
-                                rect.top >= 0 && rect.bottom <= window.innerHeight) {
-                                foundElement = element;
-                                return true;
-                            }
-                        }
-                    }
-                    return false;
-                };
-                
-                if (searchForText()) {
-                    return {
-                        found: true,
-                        scrollCount: 0,
-                        message: 'Text "' + text + '" is already visible'
-                    };
-                }
-                
-                while (scrollCount < maxScrolls && !found) {
-                    const oldScrollTop = isRoot ? window.scrollY : container.scrollTop;
-                    
-                    if (isRoot) {
-                        window.scrollBy(0, scrollAmount);
-                    } else {
-                        container.scrollBy(0, scrollAmount);
-                    }
-                    
-                    await new Promise(r => setTimeout(r, 300));
-                    
-                    scrollCount++;
-                    
-                    if (searchForText()) {
-                        found = true;
-                        break;
-                    }
-                    
-                    const newScrollTop = isRoot ? window.scrollY : container.scrollTop;
-                    if (newScrollTop === oldScrollTop) {
-                        break;
-                    }
-                }
-                
-                return {
-                    found: found,
-                    scrollCount: scrollCount,
-                    message: found ? 
-                        'Found "' + text + '" after ' + scrollCount + ' scrolls' : 
-                        'Text "' + text + '" not found after ' + scrollCount + ' scrolls'
-                };
-            }
-            """
-            
             options = {
                 "text": params.text,
                 "maxScrolls": params.max_scrolls,
@@ -631,7 +336,7 @@ def register_enhanced_scroll_actions(controller: Controller) -> None:
                 "containerSelector": params.container_selector
             }
             
-            result = await page.evaluate(js_code, options)
+            result = json.loads(await _run_scroll_helper(page, 'scrollUntilVisible', options))
             
             logger.info(result['message'])
             return ActionResult(
@@ -654,55 +359,25 @@ def register_enhanced_scroll_actions(controller: Controller) -> None:
         page = await browser_session.get_current_page()
         
         try:
-            initial_count = 0
-            if params.item_selector:
-                initial_count = await page.evaluate(
-                    f"document.querySelectorAll('{params.item_selector}').length"
-                )
-            
-            total_scrolls = 0
-            no_new_content_count = 0
-            last_height = await page.evaluate("document.body.scrollHeight")
-            
-            while total_scrolls < params.max_scrolls:
-                # Scroll to bottom
-                await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-                
-                # Wait for new content
-                await asyncio.sleep(params.wait_time)
-                
-                # Check if new content loaded
-                new_height = await page.evaluate("document.body.scrollHeight")
-                
-                if params.item_selector:
-                    current_count = await page.evaluate(
-                        f"document.querySelectorAll('{params.item_selector}').length"
-                    )
-                    
-                    if params.max_items and current_count >= params.max_items:
-                        msg = f"🔄 Loaded {current_count} items (reached limit of {params.max_items})"
-                        logger.info(msg)
-                        return ActionResult(
-                            data={"itemsLoaded": current_count, "scrollCount": total_scrolls},
-                            extracted_content=msg,
-                            include_in_memory=True
-                        )
-                
-                if new_height == last_height:
-                    no_new_content_count += 1
-                    if no_new_content_count >= 3:
-                        break
-                else:
-                    no_new_content_count = 0
-                    last_height = new_height
-                
-                total_scrolls += 1
+            options = {
+                "maxItems": params.max_items,
+                "maxScrolls": params.max_scrolls,
+                "waitTime": params.wait_time,
+                "itemSelector": params.item_selector
+            }
             
-            # Final count
-            final_count = initial_count
-            if params.item_selector:
-                final_count = await page.evaluate(
-                    f"document.querySelectorAll('{params.item_selector}').length"
+            result = await _run_scroll_helper(page, 'infiniteScroll', options)
+            initial_count = result['initialCount']
+            final_count = result['finalCount']
+            total_scrolls = result['scrollCount']
+            
+            if result['reachedLimit']:
+                msg = f"🔄 Loaded {final_count} items (reached limit of {params.max_items})"
+                logger.info(msg)
+                return ActionResult(
+                    data={"itemsLoaded": final_count, "scrollCount": total_scrolls},
+                    extracted_content=msg,
+                    include_in_memory=True
                 )
             
             msg = f"🔄 Infinite scroll complete: {total_scrolls} scrolls"
@@ -775,172 +450,6 @@ def register_enhanced_scroll_actions(controller: Controller) -> None:
         page = await browser_session.get_current_page()
         
         try:
-            js_code = """
-            async (options) => {
-                const { text, containerSelector, maxScrollsPerDirection, scrollAmount } = options;
-                
-                let container = null;
-                if (containerSelector) {
-                    container = document.querySelector(containerSelector);
-                    if (!container) {
-                        throw new Error('Container not found: ' + containerSelector);
-                    }
-                } else {
-                    const bigEnough = el => el.clientHeight >= window.innerHeight * 0.5;
-                    const canScroll = el =>
-                        el &&
-                        /(auto|scroll|overlay)/.test(getComputedStyle(el).overflowY) &&
-                        el.scrollHeight > el.clientHeight &&
-                        bigEnough(el);
-                    
-                    container = [...document.querySelectorAll('*')].find(canScroll)
-                        || document.scrollingElement
-                        || document.documentElement;
-                }
-                
-                const isRoot = container === document.scrollingElement || 
-                              container === document.documentElement || 
-                              container === document.body;
-                
-                const searchForText = () => {
-                    const walker = document.createTreeWalker(
-                        container || document.body,
-                        NodeFilter.SHOW_TEXT,
-                        null,
-                        false
-                    );
-                    
-                    let node;
-                    while (node = walker.nextNode()) {
-                        const nodeText = node.nodeValue.trim();
-                        if (nodeText && nodeText.toLowerCase().includes(text.toLowerCase())) {
-                            const element = node.parentElement;
-                            if (element) {
-                                const rect = element.getBoundingClientRect();
-                                if (rect.width > 0 && rect.height > 0 && 
-                                    rect.top >= -10 && rect.bottom <= window.innerHeight + 10 &&
-                                    rect.left >= -10 && rect.right <= window.innerWidth + 10) {
-                                    return true;
-                                }
-                            }
-                        }
-                    }
-                    
-                    const elements = (container || document).querySelectorAll('button, a, [aria-label], [role="button"]');
-                    for (const el of elements) {
-                        const elementText = (el.textContent || '').trim();
-                        const ariaLabel = el.getAttribute('aria-label') || '';
-                        const combinedText = elementText + ' ' + ariaLabel;
-                        
-                        if (combinedText.toLowerCase().includes(text.toLowerCase())) {
-                            const rect = el.getBoundingClientRect();
-                            if (rect.width > 0 && rect.height > 0 && 
-                                rect.top >= -10 && rect.bottom <= window.innerHeight + 10 &&
-                                rect.left >= -10 && rect.right <= window.innerWidth + 10) {
-                                return true;
-                            }
-                        }
-                    }
-                    
-                    return false;
-                };
-                
-                if (searchForText()) {
-                    return {
-                        found: true,
-                        direction: 'none',
-                        scrollCount: 0,
-                        message: 'Text "' + text + '" is already visible'
-                    };
-                }
-                
-                const scrollTop = isRoot ? window.scrollY : container.scrollTop;
-                const maxScroll = container.scrollHeight - container.clientHeight;
-                const scrollPercent = maxScroll > 0 ? (scrollTop / maxScroll) * 100 : 0;
-                
-                // Use pattern hint if provided
-                let directions = [];
-                if (options.patternHint) {
-                    const hint = options.patternHint;
-                    if (hint.start_position === 'bottom' && scrollPercent < 50) {
-                        // Jump to bottom first if pattern suggests it
-                        if (isRoot) {
-                            window.scrollTo(0, maxScroll);
-                        } else {
-                            container.scrollTop = maxScroll;
-                        }
-                        await new Promise(r => setTimeout(r, 500));
-                        directions = ['up', 'down'];
-                    } else if (hint.preferred === 'down') {
-                        directions = ['down', 'up'];
-                    } else {
-                        directions = ['up', 'down'];
-                    }
-                } else {
-                    // Default behavior based on current position
-                    if (scrollPercent >= 90) {
-                        directions = ['up', 'down'];
-                    } else if (scrollPercent <= 10) {
-                        directions = ['down', 'up'];
-                    } else {
-                        directions = ['down', 'up'];
-                    }
-                }
-                
-                const results = {
-                    found: false,
-                    direction: 'none',
-                    scrollCount: 0,
-                    triedDirections: [],
-                    initialPosition: scrollPercent
-                };
-                
-                for (const direction of directions) {
-                    results.triedDirections.push(direction);
-                    
-                    if (results.triedDirections.length > 1) {
-                        if (isRoot) {
-                            window.scrollTo(0, scrollTop);
-                        } else {
-                            container.scrollTop = scrollTop;
-                        }
-                        await new Promise(r => setTimeout(r, 100));
-                    }
-                    
-                    const scrollStep = direction === 'up' ? -scrollAmount : scrollAmount;
-                    let scrollsInDirection = 0;
-                    
-                    while (scrollsInDirection < maxScrollsPerDirection) {
-                        const oldScroll = isRoot ? window.scrollY : container.scrollTop;
-                        
-                        if (isRoot) {
-                            window.scrollBy(0, scrollStep);
-                        } else {
-                            container.scrollBy(0, scrollStep);
-                        }
-                        
-                        await new Promise(r => setTimeout(r, 300));
-                        scrollsInDirection++;
-                        results.scrollCount++;
-                        
-                        if (searchForText()) {
-                            results.found = true;
-                            results.direction = direction;
-                            return results;
-                        }
-                        
-                        const newScroll = isRoot ? window.scrollY : container.scrollTop;
-                        if ((direction === 'up' && newScroll <= 5) || 
-                            (direction === 'down' && newScroll >= maxScroll - 5)) {
-                            break;
-                        }
-                    }
-                }
-                
-                return results;
-            }
-            """
-            
             options = {
                 "text": params.text,
                 "containerSelector": params.container_selector,
@@ -949,7 +458,7 @@ def register_enhanced_scroll_actions(controller: Controller) -> None:
                 "patternHint": pattern_hint
             }
             
-            result = await page.evaluate(js_code, options)
+            result = await _run_scroll_helper(page, 'smartScrollToFind', options)
             
             if result['found']:
                 msg = f"🎯 Found '{params.text}' by scrolling {result['direction']} ({result['scrollCount']} scrolls)"
@@ -253,7 +253,7 @@ class Controller(Generic[Context]):
 								element_node = node_element
 								element_text = node_text
 								break
-						except:
+						except Exception:
 							continue
 					else:
 						# Couldn't find element with expected text
@@ -74,7 +74,7 @@ class DomService:
 					self._cache_hits += 1
 					self.logger.debug(f'DOM cache hit for {current_url} (hits: {self._cache_hits}, misses: {self._cache_misses})')
 					return DOMState(element_tree=self._dom_cache.element_tree, selector_map=self._dom_cache.selector_map)
-			except:
+			except Exception:
 				# If hash check fails, invalidate cache
 				self._dom_cache = None
 		
@@ -94,7 +94,7 @@ class DomService:
 					selector_map=selector_map,
 					timestamp=time.time()
 				)
-			except:
+			except Exception:
 				# If caching fails, continue without it
 				pass
 		
@@ -0,0 +1,166 @@
+"""
+Tests for how BrowserSession reads the page state it reports to the agent.
+
+Tests cover:
+1. The state summary title is read from the current page, not from the tab listing
+2. A failing tab listing surfaces as its own exception and cancels the overlapping screenshot
+3. get_tabs_info reads titles concurrently, listing hung tabs as ignorable in their original position
+4. _wait_for_stable_network stops waiting on a request once it has failed
+"""
+
+import asyncio
+
+import pytest
+from pytest_httpserver import HTTPServer
+
+from browser_use.browser import BrowserSession
+from browser_use.browser.views import TabInfo
+
+
+@pytest.fixture(scope='session')
+def http_server():
+	server = HTTPServer()
+	server.start()
+	server.expect_request('/page1').respond_with_data(
+		'<html><head><title>Test Page 1</title></head><body><h1>Test Page 1</h1></body></html>', content_type='text/html'
+	)
+	server.expect_request('/page2').respond_with_data(
+		'<html><head><title>Test Page 2</title></head><body><h1>Test Page 2</h1></body></html>', content_type='text/html'
+	)
+	server.expect_request('/page3').respond_with_data(
+		'<html><head><title>Test Page 3</title></head><body><h1>Test Page 3</h1></body></html>', content_type='text/html'
+	)
+	yield server
+	server.stop()
+
+
+@pytest.fixture(scope='session')
+def base_url(http_server):
+	return f'http://{http_server.host}:{http_server.port}'
+
+
+# function scoped: _get_updated_state() falls back to the last good state, so each test needs a session without one
+@pytest.fixture(scope='function')
+async def browser_session():
+	browser_session = BrowserSession(headless=True, user_data_dir=None)
+	await browser_session.start()
+	yield browser_session
+	await browser_session.kill()
+
+
+async def open_page(browser_session: BrowserSession, url: str):
+	page = await browser_session.get_current_page()
+	await page.goto(url)
+	await page.wait_for_load_state()
+	return page
+
+
+class TestUpdatedState:
+	async def test_title_is_read_from_current_page(self, browser_session, base_url, monkeypatch):
+		await open_page(browser_session, f'{base_url}/page1')
+
+		# what get_tabs_info() lists for a tab whose title didn't load in time
+		async def slow_tabs_info(self):
+			return [TabInfo(page_id=0, url='about:blank', title='ignore this tab and do not use it')]
+
+		monkeypatch.setattr(BrowserSession, 'get_tabs_info', slow_tabs_info)
+
+		state = await browser_session._get_updated_state()
+
+		assert state.title == 'Test Page 1'
+		assert state.tabs[0].title == 'ignore this tab and do not use it'
+
+	async def test_tab_listing_error_is_unwrapped_and_cancels_screenshot(self, browser_session, base_url, monkeypatch):
+		await open_page(browser_session, f'{base_url}/page1')
+		screenshot_cancelled = asyncio.Event()
+
+		async def failing_tabs_info(self):
+			await asyncio.sleep(0.1)
+			raise RuntimeError('tab listing failed')
+
+		async def slow_screenshot(self, full_page: bool = False):
+			try:
+				await asyncio.sleep(10)
+			except asyncio.CancelledError:
+				screenshot_cancelled.set()
+				raise
+			return ''
+
+		monkeypatch.setattr(BrowserSession, 'get_tabs_info', failing_tabs_info)
+		monkeypatch.setattr(BrowserSession, 'take_screenshot', slow_screenshot)
+
+		# the original error, not the ExceptionGroup wrapping it
+		with pytest.raises(RuntimeError, match='tab listing failed'):
+			await browser_session._get_updated_state()
+
+		assert screenshot_cancelled.is_set()
+
+
+class TestTabsInfo:
+	async def open_tabs(self, browser_session: BrowserSession, base_url: str):
+		await open_page(browser_session, f'{base_url}/page1')
+		await browser_session.create_new_tab(f'{base_url}/page2')
+		await browser_session.create_new_tab(f'{base_url}/page3')
+		return browser_session.browser_context.pages
+
+	async def test_hung_tabs_are_listed_in_place(self, browser_session, base_url, monkeypatch):
+		pages = await self.open_tabs(browser_session, base_url)
+
+		async def hanging_title():
+			await asyncio.sleep(10)
+
+		monkeypatch.setattr(pages[0], 'title', hanging_title)
+		monkeypatch.setattr(pages[1], 'title', hanging_title)
+
+		start = asyncio.get_event_loop().time()
+		tabs_info = await browser_session.get_tabs_info()
+		elapsed = asyncio.get_event_loop().time() - start
+
+		assert [tab.page_id for tab in tabs_info] == [0, 1, 2]
+		assert [tab.title for tab in tabs_info] == [
+			'ignore this tab and do not use it',
+			'ignore this tab and do not use it',
+			'Test Page 3',
+		]
+		assert tabs_info[0].url == 'about:blank'
+		assert tabs_info[2].url == f'{base_url}/page3'
+		# both 1s timeouts ran at the same time
+		assert elapsed < 1.9
+
+	async def test_other_title_errors_are_raised(self, browser_session, base_url, monkeypatch):
+		pages = await self.open_tabs(browser_session, base_url)
+
+		async def failing_title():
+			raise RuntimeError('page crashed')
+
+		monkeypatch.setattr(pages[1], 'title', failing_title)
+
+		with pytest.raises(RuntimeError, match='page crashed'):
+			await browser_session.get_tabs_info()
+
+
+class TestStableNetwork:
+	async def test_failed_request_is_not_waited_for(self, browser_session, base_url):
+		page = await open_page(browser_session, f'{base_url}/page1')
+		aborted = asyncio.Event()
+
+		async def abort(route):
+			await route.abort()
+			aborted.set()
+
+		await page.route('**/blocked.js', abort)
+
+		start = asyncio.get_event_loop().time()
+		wait_task = asyncio.create_task(browser_session._wait_for_stable_network())
+		await asyncio.sleep(0.2)  # let it attach its listeners
+		await page.evaluate("""() => {
+			const script = document.createElement('script');
+			script.src = '/blocked.js';
+			document.head.appendChild(script);
+		}""")
+		await wait_task
+		elapsed = asyncio.get_event_loop().time() - start
+
+		assert aborted.is_set()
+		# a request left pending would keep it waiting until maximum_wait_page_load_time
+		assert elapsed < browser_session.browser_profile.maximum_wait_page_load_time - 2
@@ -0,0 +1,284 @@
+"""
+Tests for the enhanced scrolling actions against a real browser.
+
+Tests cover:
+1. handle_infinite_scroll loads lazily appended items and stops when the feed ends
+2. handle_infinite_scroll stops early once max_items is reached
+3. The page-side helpers are installed on documents loaded after the first scroll action
+4. batched_scroll performs every scroll in order and describes each one
+5. detect_scrollable_areas ranks visible areas largest first and lists only top_n of them
+6. Selectors returned for areas with awkward ids/classes can be passed back as target_selector
+7. enhanced_scroll and scroll_until_visible scroll an auto-detected pane instead of the window
+8. scroll_to_element brings an element below the fold into view
+"""
+
+import pytest
+from pytest_httpserver import HTTPServer
+
+from browser_use.agent.views import ActionResult
+from browser_use.browser import BrowserSession
+from browser_use.controller.actions import register_enhanced_scroll_actions
+from browser_use.controller.service import Controller
+
+INFINITE_FEED_HTML = """
+<html>
+<head><title>Infinite Feed</title></head>
+<body>
+	<div id="feed"></div>
+	<script>
+		const feed = document.getElementById('feed');
+		let loaded = 0;
+		function loadMore() {
+			for (let i = 0; i < 10; i++) {
+				const item = document.createElement('div');
+				item.className = 'item';
+				item.style.height = '200px';
+				item.textContent = 'Item ' + loaded++;
+				feed.appendChild(item);
+			}
+		}
+		loadMore();
+		window.addEventListener('scroll', () => {
+			if (loaded < 30 && window.innerHeight + window.scrollY >= document.body.scrollHeight - 10) {
+				setTimeout(loadMore, 100);
+			}
+		});
+	</script>
+</body>
+</html>
+"""
+
+# three visible panels of different sizes, one below the fold, and one whose id and class need escaping
+SCROLLABLE_AREAS_HTML = """
+<html>
+<head><title>Scrollable Areas</title></head>
+<body>
+	<div id="small" style="width: 100px; height: 100px; overflow: auto"><div style="height: 1000px"></div></div>
+	<div id="large" style="width: 400px; height: 200px; overflow: auto"><div style="height: 1000px"></div></div>
+	<div id="medium" style="width: 200px; height: 150px; overflow: auto"><div style="height: 1000px"></div></div>
+	<div id="results:list" class="2col" style="width: 50px; height: 50px; overflow: auto"><div style="height: 1000px"></div></div>
+	<div style="height: 300vh"></div>
+	<div id="below" style="width: 800px; height: 400px; overflow: auto"><div style="height: 1000px"></div></div>
+</body>
+</html>
+"""
+
+# the document itself doesn't scroll, only the content pane does
+MAIN_CONTENT_PANE_HTML = """
+<html>
+<head><title>Content Pane</title></head>
+<body style="margin: 0">
+	<div class="main-content" style="height: 90vh; overflow: auto">
+		<div style="height: 3000px"></div>
+		<p>Needle paragraph</p>
+		<div style="height: 2000px"></div>
+	</div>
+</body>
+</html>
+"""
+
+
+@pytest.fixture(scope='session')
+def http_server():
+	server = HTTPServer()
+	server.start()
+	server.expect_request('/feed').respond_with_data(INFINITE_FEED_HTML, content_type='text/html')
+	server.expect_request('/tall').respond_with_data(
+		'<html><body><div style="height: 5000px">Tall page</div></body></html>', content_type='text/html'
+	)
+	server.expect_request('/areas').respond_with_data(SCROLLABLE_AREAS_HTML, content_type='text/html')
+	server.expect_request('/pane').respond_with_data(MAIN_CONTENT_PANE_HTML, content_type='text/html')
+	server.expect_request('/target').respond_with_data(
+		'<body><div style="height: 200vh"></div><div id="target">Target</div><div style="height: 100vh"></div></body>',
+		content_type='text/html',
+	)
+	yield server
+	server.stop()
+
+
+@pytest.fixture(scope='session')
+def base_url(http_server):
+	return f'http://{http_server.host}:{http_server.port}'
+
+
+@pytest.fixture(scope='module')
+async def browser_session():
+	browser_session = BrowserSession(headless=True, user_data_dir=None)
+	await browser_session.start()
+	yield browser_session
+	await browser_session.stop()
+
+
+@pytest.fixture(scope='function')
+def controller():
+	controller = Controller()
+	register_enhanced_scroll_actions(controller)
+	return controller
+
+
+async def open_page(browser_session: BrowserSession, url: str):
+	page = await browser_session.get_current_page()
+	await page.goto(url)
+	await page.wait_for_load_state()
+	return page
+
+
+class TestInfiniteScroll:
+	async def test_loads_items_until_feed_ends(self, controller, browser_session, base_url):
+		await open_page(browser_session, f'{base_url}/feed')
+
+		result = await controller.registry.execute_action(
+			'handle_infinite_scroll',
+			{'item_selector': '.item', 'wait_time': 1.0, 'max_scrolls': 10},
+			browser_session=browser_session,
+		)
+
+		assert isinstance(result, ActionResult)
+		assert result.error is None
+		assert 'loaded 20 new items (total: 30)' in result.extracted_content
+
+	async def test_stops_at_max_items(self, controller, browser_session, base_url):
+		await open_page(browser_session, f'{base_url}/feed')
+
+		result = await controller.registry.execute_action(
+			'handle_infinite_scroll',
+			{'item_selector': '.item', 'max_items': 15, 'wait_time': 1.0, 'max_scrolls': 10},
+			browser_session=browser_session,
+		)
+
+		assert result.error is None
+		assert 'Loaded 20 items (reached limit of 15)' in result.extracted_content
+
+
+class TestScrollHelpers:
+	async def test_helpers_present_after_navigation(self, controller, browser_session, base_url):
+		page = await open_page(browser_session, f'{base_url}/feed')
+		await controller.registry.execute_action('detect_scrollable_areas', {}, browser_session=browser_session)
+
+		# the init script installs them before the new document's own scripts run
+		await page.goto(f'{base_url}/feed')
+		assert await page.evaluate('typeof window.__buScroll') == 'object'
+
+
+class TestBatchedScroll:
+	async def test_runs_scrolls_in_order(self, controller, browser_session, base_url):
+		page = await open_page(browser_session, f'{base_url}/tall')
+
+		result = await controller.registry.execute_action(
+			'batched_scroll',
+			{
+				'scrolls': [
+					{'direction': 'down', 'amount': 300},
+					{'direction': 'down', 'amount': 200},
+					{'direction': 'up', 'amount': 100},
+				]
+			},
+			browser_session=browser_session,
+		)
+
+		assert result.error is None
+		assert 'Performed 3 scrolls' in result.extracted_content
+		assert '1. Scrolled down by 300 pixels' in result.extracted_content
+		assert '3. Scrolled up by 100 pixels' in result.extracted_content
+		assert await page.evaluate('window.scrollY') == 400
+
+	async def test_reports_scrolls_done_before_a_failure(self, controller, browser_session, base_url):
+		page = await open_page(browser_session, f'{base_url}/tall')
+
+		result = await controller.registry.execute_action(
+			'batched_scroll',
+			{'scrolls': [{'direction': 'down', 'amount': 300}, {'direction': 'down', 'target_selector': '#missing'}]},
+			browser_session=browser_session,
+		)
+
+		assert 'scroll 2 failed: Container not found: #missing' in result.error
+		assert '1. Scrolled down by 300 pixels' in result.error
+		assert await page.evaluate('window.scrollY') == 300
+
+
+class TestDetectScrollableAreas:
+	async def test_lists_top_n_visible_areas_largest_first(self, controller, browser_session, base_url):
+		await open_page(browser_session, f'{base_url}/areas')
+
+		result = await controller.registry.execute_action(
+			'detect_scrollable_areas', {'top_n': 2}, browser_session=browser_session
+		)
+
+		assert result.error is None
+		# count and summary cover every area, not just the listed ones
+		assert 'Found 5 scrollable areas' in result.extracted_content
+		assert 'Visible scrollable areas: 4' in result.extracted_content
+		assert '1. div#large - ' in result.extracted_content
+		assert '(selector: div#large)' in result.extracted_content
+		assert '2. div#medium - ' in result.extracted_content
+		assert '3. ' not in result.extracted_content
+		assert 'div#below' not in result.extracted_content
+
+	async def test_escaped_selector_round_trips_as_target_selector(self, controller, browser_session, base_url):
+		page = await open_page(browser_session, f'{base_url}/areas')
+		areas = await controller.registry.execute_action(
+			'detect_scrollable_areas', {'top_n': 10}, browser_session=browser_session
+		)
+
+		# the selector the agent sees in the listing, div#results\:list.\32 col
+		line = next(line for line in areas.extracted_content.splitlines() if 'div#results:list' in line)
+		selector = line.rsplit('(selector: ', 1)[1].removesuffix(')')
+
+		result = await controller.registry.execute_action(
+			'enhanced_scroll',
+			{'direction': 'down', 'amount': 200, 'target_selector': selector},
+			browser_session=browser_session,
+		)
+
+		assert result.error is None
+		assert await page.evaluate("document.getElementById('results:list').scrollTop") == 200
+		assert await page.evaluate('window.scrollY') == 0
+
+
+class TestContainerAutoDetection:
+	async def test_enhanced_scroll_scrolls_main_content_pane(self, controller, browser_session, base_url):
+		page = await open_page(browser_session, f'{base_url}/pane')
+
+		result = await controller.registry.execute_action(
+			'enhanced_scroll', {'direction': 'down', 'amount': 300}, browser_session=browser_session
+		)
+
+		assert result.error is None
+		assert 'Scrolled down by 300 pixels' in result.extracted_content
+		assert await page.evaluate("document.querySelector('.main-content').scrollTop") == 300
+		assert await page.evaluate('window.scrollY') == 0
+
+	async def test_scroll_until_visible_finds_text_in_pane(self, controller, browser_session, base_url):
+		page = await open_page(browser_session, f'{base_url}/pane')
+
+		result = await controller.registry.execute_action(
+			'scroll_until_visible',
+			{'text': 'needle paragraph', 'scroll_amount': 500, 'max_scrolls': 10},
+			browser_session=browser_session,
+		)
+
+		assert result.error is None
+		assert 'Found "needle paragraph" after' in result.extracted_content
+		assert await page.evaluate("document.querySelector('.main-content').scrollTop") > 0
+		assert await page.evaluate('window.scrollY') == 0
+
+
+class TestScrollToElement:
+	async def test_scrolls_element_into_view(self, controller, browser_session, base_url):
+		page = await open_page(browser_session, f'{base_url}/target')
+
+		result = await controller.registry.execute_action(
+			'scroll_to_element',
+			{'selector': '#target', 'alignment': 'start', 'smooth': False},
+			browser_session=browser_session,
+		)
+
+		assert result.error is None
+		assert "Scrolled to element '#target' (alignment: start)" in result.extracted_content
+		assert await page.evaluate("Math.round(document.getElementById('target').getBoundingClientRect().top)") == 0
+
+		result = await controller.registry.execute_action(
+			'scroll_to_element', {'selector': '#target', 'smooth': False}, browser_session=browser_session
+		)
+
+		assert "Element '#target' was already visible" in result.extracted_content
@@ -0,0 +1,189 @@
+"""
+Tests for the token-budget trimming helpers on MessageHistory.
+
+Tests cover:
+1. The cached message class on MessageMetadata, including for message subclasses
+2. apply_sliding_window drops the oldest unprotected messages first
+3. System messages and the most recent messages are never dropped
+4. compress_history summarizes and removes everything older than the last 5 messages
+5. The cached langchain serialization of a message is refreshed when the message changes
+"""
+
+from langchain_core.messages import AIMessage, AIMessageChunk, HumanMessage, HumanMessageChunk, SystemMessage
+
+from browser_use.agent.message_manager.views import ManagedMessage, MessageHistory, MessageMetadata
+
+
+def build_history(*messages: tuple[type, int]) -> MessageHistory:
+	history = MessageHistory()
+	for i, (message_cls, tokens) in enumerate(messages):
+		history.add_message(message_cls(content=f'message {i}'), MessageMetadata(tokens=tokens))
+	return history
+
+
+def contents(history: MessageHistory) -> list[str]:
+	return [m.message.content for m in history.messages]
+
+
+def test_message_class_is_cached_and_survives_serialization():
+	history = build_history((SystemMessage, 1), (HumanMessage, 1), (AIMessage, 1))
+	history.add_message(HumanMessage(content='tagged'), MessageMetadata(tokens=1, message_type='init'))
+
+	assert [m.metadata.message_class for m in history.messages] == [
+		'SystemMessage',
+		'HumanMessage',
+		'AIMessage',
+		'HumanMessage',
+	]
+	# the caller-provided message_type tag is left alone
+	assert history.messages[-1].metadata.message_type == 'init'
+
+	restored = ManagedMessage.model_validate(history.messages[2].model_dump())
+	assert isinstance(restored.message, AIMessage)
+	assert restored.metadata.message_class == 'AIMessage'
+
+
+def test_message_class_covers_subclasses_and_leaves_shared_metadata_alone():
+	shared = MessageMetadata(tokens=1)
+	history = build_history((SystemMessage, 1), (AIMessage, 1))
+	history.add_message(AIMessageChunk(content='streamed'), shared)
+	history.add_message(HumanMessageChunk(content='state'), shared)
+
+	assert [m.metadata.message_class for m in history.messages[2:]] == ['AIMessage', 'HumanMessage']
+	assert shared.message_class is None
+
+	# the chunk subclass is still treated as the state message
+	history.remove_last_state_message()
+	assert contents(history) == ['message 0', 'message 1', 'streamed']
+
+
+def test_sliding_window_noop_under_budget():
+	history = build_history((SystemMessage, 10), (HumanMessage, 10), (AIMessage, 10))
+
+	history.apply_sliding_window(max_tokens=30)
+
+	assert contents(history) == ['message 0', 'message 1', 'message 2']
+	assert history.current_tokens == 30
+
+
+def test_sliding_window_drops_oldest_until_under_budget():
+	history = build_history(
+		(SystemMessage, 10),
+		(HumanMessage, 20),
+		(AIMessage, 20),
+		(HumanMessage, 20),
+		(AIMessage, 20),
+		(HumanMessage, 20),
+	)
+
+	history.apply_sliding_window(max_tokens=75, preserve_recent=2)
+
+	# message 1 and 2 go, message 3 survives because we are under budget by then
+	assert contents(history) == ['message 0', 'message 3', 'message 4', 'message 5']
+	assert history.current_tokens == 70
+	assert history.current_tokens == sum(m.metadata.tokens for m in history.messages)
+
+
+def test_sliding_window_never_drops_system_or_recent_messages():
+	history = build_history(
+		(SystemMessage, 50),
+		(HumanMessage, 10),
+		(SystemMessage, 50),
+		(AIMessage, 10),
+		(HumanMessage, 100),
+	)
+
+	history.apply_sliding_window(max_tokens=10, preserve_recent=1)
+
+	assert contents(history) == ['message 0', 'message 2', 'message 4']
+	assert history.current_tokens == 200
+
+
+def test_sliding_window_preserves_everything_when_history_is_short():
+	history = build_history((HumanMessage, 100), (AIMessage, 100))
+
+	history.apply_sliding_window(max_tokens=10, preserve_recent=3)
+
+	assert contents(history) == ['message 0', 'message 1']
+	assert history.current_tokens == 200
+
+
+def test_compress_history_summarizes_and_removes_old_messages():
+	history = build_history(
+		(SystemMessage, 10),
+		(HumanMessage, 20),
+		(SystemMessage, 10),
+		(AIMessage, 20),
+		(HumanMessage, 20),
+		(HumanMessage, 5),
+		(HumanMessage, 5),
+		(HumanMessage, 5),
+		(HumanMessage, 5),
+		(HumanMessage, 5),
+	)
+
+	summary = history.compress_history(max_tokens=50)
+
+	assert summary == 'Previous actions summary:\n• State: message 1\n• State: message 4'
+	assert contents(history) == ['message 0', 'message 2', 'message 5', 'message 6', 'message 7', 'message 8', 'message 9']
+	assert history.current_tokens == 45
+	assert history.current_tokens == sum(m.metadata.tokens for m in history.messages)
+
+
+def test_compress_history_noop_when_nothing_to_compress():
+	history = build_history((SystemMessage, 100), (HumanMessage, 100), (AIMessage, 100))
+
+	assert history.compress_history(max_tokens=10) is None
+	assert contents(history) == ['message 0', 'message 1', 'message 2']
+	assert history.current_tokens == 300
+
+
+def test_compress_history_summary_formats_actions_and_long_state():
+	history = build_history((SystemMessage, 10))
+	history.add_message(
+		AIMessage(
+			content='',
+			tool_calls=[
+				{'name': 'AgentOutput', 'args': {'action': [{'click_element_by_index': {'index': 1}}]}, 'id': '1', 'type': 'tool_call'}
+			],
+		),
+		MessageMetadata(tokens=50),
+	)
+	history.add_message(HumanMessage(content='x' * 150), MessageMetadata(tokens=50))
+	for _ in range(5):
+		history.add_message(HumanMessage(content='recent'), MessageMetadata(tokens=1))
+
+	summary = history.compress_history(max_tokens=50)
+
+	assert summary == f'Previous actions summary:\n• Executed: click_element_by_index\n• State: {"x" * 100}...'
+	assert history.current_tokens == 15
+
+
+def test_message_dump_is_reused_until_message_changes():
+	managed = ManagedMessage(
+		message=HumanMessage(content=[{'type': 'text', 'text': 'state'}, {'type': 'image_url', 'image_url': {'url': 'x'}}]),
+		metadata=MessageMetadata(tokens=1),
+	)
+
+	managed.model_dump()
+	cached = managed._message_dump
+	managed.model_dump()
+	assert managed._message_dump is cached
+
+	# in-place edits, like cut_messages() removing the screenshot, are picked up once the cache is cleared
+	managed.message.content.pop()
+	managed.clear_message_dump()
+	dumped = managed.model_dump()
+	assert ManagedMessage.model_validate(dumped).message.content == [{'type': 'text', 'text': 'state'}]
+
+	# replacing the message invalidates the cache without any help
+	managed.message = HumanMessage(content='replaced')
+	assert ManagedMessage.model_validate(managed.model_dump()).message.content == 'replaced'
+
+
+def test_compress_history_noop_when_history_fits_in_recent_window():
+	history = build_history(*[(HumanMessage, 100)] * 5)
+
+	assert history.compress_history(max_tokens=10) is None
+	assert len(history.messages) == 5
+	assert history.current_tokens == 500
@@ -2,6 +2,8 @@
 Tests for enhanced scrolling functionality.
 """
 
+import json
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -9,6 +11,7 @@ from browser_use.controller.actions.enhanced_scroll import (
     ScrollDirection,
     ScrollStrategy,
     EnhancedScrollAction,
+    DetectScrollableAreasAction,
     ScrollToElementAction,
     ScrollUntilVisibleAction,
     InfiniteScrollAction,
@@ -39,7 +42,7 @@ def controller_with_scroll_actions():
 async def test_enhanced_scroll_down_pixels(controller_with_scroll_actions, mock_browser_session):
     """Test basic downward scrolling by pixels"""
     session, page = mock_browser_session
-    page.evaluate = AsyncMock(return_value={"scrolledY": 300, "hasMoreContent": {"down": True}})
+    page.evaluate = AsyncMock(return_value=json.dumps({"scrolledY": 300, "hasMoreContent": {"down": True}}))
     
     params = EnhancedScrollAction(
         direction=ScrollDirection.DOWN,
@@ -47,7 +50,7 @@ async def test_enhanced_scroll_down_pixels(controller_with_scroll_actions, mock_
         strategy=ScrollStrategy.PIXELS
     )
     
-    result = await controller_with_scroll_actions.registry.actions["enhanced_scroll"].function(
+    result = await controller_with_scroll_actions.registry.registry.actions["enhanced_scroll"].function(
         params=params,
         browser_session=session
     )
@@ -61,11 +64,11 @@ async def test_enhanced_scroll_down_pixels(controller_with_scroll_actions, mock_
 async def test_enhanced_scroll_with_target_selector(controller_with_scroll_actions, mock_browser_session):
     """Test scrolling a specific container"""
     session, page = mock_browser_session
-    page.evaluate = AsyncMock(return_value={
+    page.evaluate = AsyncMock(return_value=json.dumps({
         "container": ".my-container",
         "scrolledY": 200,
         "hasMoreContent": {"down": False}
-    })
+    }))
     
     params = EnhancedScrollAction(
         direction=ScrollDirection.DOWN,
@@ -73,33 +76,35 @@ async def test_enhanced_scroll_with_target_selector(controller_with_scroll_actio
         target_selector=".my-container"
     )
     
-    result = await controller_with_scroll_actions.registry.actions["enhanced_scroll"].function(
+    result = await controller_with_scroll_actions.registry.registry.actions["enhanced_scroll"].function(
         params=params,
         browser_session=session
     )
     
     assert not result.error
     assert "in .my-container" in result.extracted_content
-    assert "reached limit" in result.extracted_content
+    assert "reached scroll limits" in result.extracted_content
 
 
 @pytest.mark.asyncio
 async def test_detect_scrollable_areas(controller_with_scroll_actions, mock_browser_session):
     """Test detecting scrollable areas on a page"""
     session, page = mock_browser_session
-    page.evaluate = AsyncMock(return_value={
+    page.evaluate = AsyncMock(return_value=json.dumps({
         "count": 2,
         "elements": [
             {
                 "description": "div.content-area",
+                "selector": "div.content-area",
                 "isVisible": True,
-                "scrollInfo": {"canScrollDown": True, "canScrollUp": False}
+                "scrollInfo": {"canScrollDown": True, "canScrollUp": False, "position": "top", "scrollPercent": 0}
             },
             {
                 "description": "ul.dropdown-menu (LinkedIn Dropdown)",
+                "selector": "ul.dropdown-menu",
                 "isVisible": True,
                 "isDropdown": True,
-                "scrollInfo": {"canScrollDown": True, "canScrollUp": False}
+                "scrollInfo": {"canScrollDown": True, "canScrollUp": True, "position": "middle", "scrollPercent": 40}
             }
         ],
         "summary": {
@@ -107,15 +112,23 @@ async def test_detect_scrollable_areas(controller_with_scroll_actions, mock_brow
             "hasDropdown": True,
             "visibleScrollables": 2
         }
-    })
+    }))
     
-    result = await controller_with_scroll_actions.registry.actions["detect_scrollable_areas"].function(
+    result = await controller_with_scroll_actions.registry.registry.actions["detect_scrollable_areas"].function(
+        params=DetectScrollableAreasAction(),
         browser_session=session
     )
     
     assert not result.error
     assert "Found 2 scrollable areas" in result.extracted_content
     assert "✓ Dropdown menu is scrollable" in result.extracted_content
+    assert "1. div.content-area - at top (0%), can scroll: ↓ down (selector: div.content-area)" in result.extracted_content
+    assert (
+        "2. ul.dropdown-menu (LinkedIn Dropdown) - at middle (40%), can scroll: ↓ down, ↑ up (selector: ul.dropdown-menu)"
+        in result.extracted_content
+    )
+    # top_n is passed through to the page helper
+    assert page.evaluate.call_args.args[1] == ["detectScrollableAreas", {"topN": 5}]
 
 
 @pytest.mark.asyncio
@@ -135,7 +148,7 @@ async def test_scroll_to_element(controller_with_scroll_actions, mock_browser_se
         smooth=True
     )
     
-    result = await controller_with_scroll_actions.registry.actions["scroll_to_element"].function(
+    result = await controller_with_scroll_actions.registry.registry.actions["scroll_to_element"].function(
         params=params,
         browser_session=session
     )
@@ -148,11 +161,11 @@ async def test_scroll_to_element(controller_with_scroll_actions, mock_browser_se
 async def test_scroll_until_visible(controller_with_scroll_actions, mock_browser_session):
     """Test scrolling until content is visible"""
     session, page = mock_browser_session
-    page.evaluate = AsyncMock(return_value={
+    page.evaluate = AsyncMock(return_value=json.dumps({
         "found": True,
         "scrollCount": 3,
         "message": "Found 'Legal issues' after 3 scrolls"
-    })
+    }))
     
     params = ScrollUntilVisibleAction(
         text="Legal issues",
@@ -160,7 +173,7 @@ async def test_scroll_until_visible(controller_with_scroll_actions, mock_browser
         scroll_amount=300
     )
     
-    result = await controller_with_scroll_actions.registry.actions["scroll_until_visible"].function(
+    result = await controller_with_scroll_actions.registry.registry.actions["scroll_until_visible"].function(
         params=params,
         browser_session=session
     )
@@ -174,23 +187,13 @@ async def test_handle_infinite_scroll(controller_with_scroll_actions, mock_brows
     """Test handling infinite scroll pages"""
     session, page = mock_browser_session
     
-    # Mock the sequence of evaluate calls
-    page.evaluate = AsyncMock()
-    page.evaluate.side_effect = [
-        10,     # Initial item count
-        1000,   # Initial page height
-        # After first scroll
-        2000,   # New page height
-        20,     # New item count
-        # After second scroll
-        3000,   # New page height
-        30,     # New item count
-        # After third scroll
-        3000,   # Same height (no new content)
-        30,     # Same item count
-        # Final count
-        30      # Final item count
-    ]
+    # The scroll/wait/measure loop runs in the page, so there is a single evaluate
+    page.evaluate = AsyncMock(return_value={
+        "initialCount": 10,
+        "finalCount": 30,
+        "scrollCount": 3,
+        "reachedLimit": False
+    })
     
     params = InfiniteScrollAction(
         max_items=50,
@@ -199,40 +202,39 @@ async def test_handle_infinite_scroll(controller_with_scroll_actions, mock_brows
         item_selector=".item"
     )
     
-    result = await controller_with_scroll_actions.registry.actions["handle_infinite_scroll"].function(
+    result = await controller_with_scroll_actions.registry.registry.actions["handle_infinite_scroll"].function(
         params=params,
         browser_session=session
     )
     
     assert not result.error
-    assert "loaded 20 new items" in result.extracted_content
-    assert result.data["finalCount"] == 30
-    assert result.data["initialCount"] == 10
+    assert "Infinite scroll complete: 3 scrolls, loaded 20 new items (total: 30)" in result.extracted_content
+    page.evaluate.assert_called_once()
 
 
 @pytest.mark.asyncio
 async def test_scroll_to_end_strategy(controller_with_scroll_actions, mock_browser_session):
     """Test scrolling to end of container"""
     session, page = mock_browser_session
-    page.evaluate = AsyncMock(return_value={
+    page.evaluate = AsyncMock(return_value=json.dumps({
         "container": "window",
         "scrolledY": 5000,
         "hasMoreContent": {"down": False, "up": True}
-    })
+    }))
     
     params = EnhancedScrollAction(
         direction=ScrollDirection.DOWN,
         strategy=ScrollStrategy.TO_END
     )
     
-    result = await controller_with_scroll_actions.registry.actions["enhanced_scroll"].function(
+    result = await controller_with_scroll_actions.registry.registry.actions["enhanced_scroll"].function(
         params=params,
         browser_session=session
     )
     
     assert not result.error
     assert "Scrolled to the down" in result.extracted_content
-    assert "reached limit" in result.extracted_content
+    assert "can scroll: up" in result.extracted_content
 
 
 @pytest.mark.asyncio
@@ -241,19 +243,19 @@ async def test_multi_directional_scroll(controller_with_scroll_actions, mock_bro
     session, page = mock_browser_session
     
     # Test horizontal scrolling
-    page.evaluate = AsyncMock(return_value={
+    page.evaluate = AsyncMock(return_value=json.dumps({
         "container": "window",
         "scrolledX": 500,
         "scrolledY": 0,
         "hasMoreContent": {"right": True, "left": False}
-    })
+    }))
     
     params = EnhancedScrollAction(
         direction=ScrollDirection.RIGHT,
         amount=500
     )
     
-    result = await controller_with_scroll_actions.registry.actions["enhanced_scroll"].function(
+    result = await controller_with_scroll_actions.registry.registry.actions["enhanced_scroll"].function(
         params=params,
         browser_session=session
     )
@@ -267,11 +269,8 @@ async def test_viewport_scroll_strategy(controller_with_scroll_actions, mock_bro
     """Test scrolling by viewport percentage"""
     session, page = mock_browser_session
     
-    # Mock viewport height
-    page.evaluate.side_effect = [
-        800,  # innerHeight
-        {"container": "window", "scrolledY": 400, "hasMoreContent": {"down": True}}
-    ]
+    # The viewport size is read inside the scroll script, so there is a single evaluate
+    page.evaluate = AsyncMock(return_value=json.dumps({"container": "window", "scrolledY": 400, "hasMoreContent": {"down": True}}))
     
     params = EnhancedScrollAction(
         direction=ScrollDirection.DOWN,
@@ -279,11 +278,12 @@ async def test_viewport_scroll_strategy(controller_with_scroll_actions, mock_bro
         strategy=ScrollStrategy.VIEWPORT
     )
     
-    result = await controller_with_scroll_actions.registry.actions["enhanced_scroll"].function(
+    result = await controller_with_scroll_actions.registry.registry.actions["enhanced_scroll"].function(
         params=params,
         browser_session=session
     )
     
     assert not result.error
     assert "using viewport strategy" in result.extracted_content
-    assert "400 pixels" in result.extracted_content  # 50% of 800px viewport
\ No newline at end of file
+    assert "400 pixels" in result.extracted_content  # 50% of 800px viewport
+    page.evaluate.assert_called_once()
\ No newline at end of file